@@ -237,6 +237,8 @@ def plot_experiment3():
         ax.axhline(y=0.05, color='gray', linestyle=':', linewidth=0.8)
         ax.set_xlabel('Coupling K')
         ax.set_ylabel(r'$r_{hetero} - r_{homo}$')
+        # Counts are offset sets, i.e. isomorphism classes weighted by
+        # multiplicity, while each curve above is one class
         n_g = N_data['n_graphs']
         n_a = N_data['n_aisync']
         n_h = N_data['n_disorder_helps']
@@ -0,0 +1,285 @@
+"""
+On-disk result caches for long-running sweeps.
+
+``CellCache`` checkpoints finished sweep cells to an append-only JSON-lines
+file, keyed by a hash of the function and the full parameter set of the
+cell. A driver that is killed partway loses at most the cells that were
+still running; re-running it skips every cell already in the file.
+
+``SimulationCache`` memoizes individual simulator calls across scripts in a
+size-bounded SQLite file. Keys hash the function, every argument (array
+contents included) and the defaults of omitted arguments, so any change in
+inputs or solver settings is a miss. The least recently used entries are
+evicted once the stored results exceed the byte budget.
+
+Delete the cache files to force a full recomputation after changing the
+simulation code.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import sqlite3
+import time
+from pathlib import Path
+
+import numpy as np
+from scipy import sparse
+
+# Byte budget of a SimulationCache unless given explicitly
+DEFAULT_MAX_BYTES = 2 * 1024**3
+
+
+def to_jsonable(value):
+    """Convert numpy containers and scalars to plain JSON types.
+
+    Arrays and tuples become lists, numpy scalars become Python scalars and
+    dict values are converted recursively. Graph objects with a
+    ``content_hash`` (``networks.Topology``, ``networks.CirculantGraph``) are
+    replaced by their type name and hash, and sparse matrices by a hash of
+    their CSR arrays.
+    """
+    if hasattr(value, 'content_hash'):
+        return f"{type(value).__name__}:{value.content_hash}"
+    if sparse.issparse(value):
+        h = hashlib.sha256()
+        _update_hash(h, value)
+        return f"sparse:{h.hexdigest()}"
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): to_jsonable(v) for k, v in value.items()}
+    return value
+
+
+def task_key(fn, task):
+    """Stable hash of a function and its keyword arguments.
+
+    Args:
+        fn: The function evaluated for the cell.
+        task: Dict of keyword arguments, may contain numpy arrays.
+
+    Returns:
+        Hex digest identifying the cell.
+    """
+    payload = json.dumps(
+        [fn.__module__, fn.__qualname__, to_jsonable(task)],
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class CellCache:
+    """Append-only JSON-lines store of finished sweep cells.
+
+    Each line is ``{"key": ..., "value": ...}``. Values are stored in JSON
+    form (see ``to_jsonable``), so arrays come back as lists.
+
+    Args:
+        path: File to read existing cells from and append new ones to.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._entries = {}
+        if self.path.exists():
+            with open(self.path) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A line cut short by an interrupted write
+                        continue
+                    self._entries[entry['key']] = entry['value']
+            # Terminate a truncated last line so new entries start cleanly
+            with open(self.path, 'rb+') as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        f.write(b'\n')
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Return the stored value for key."""
+        return self._entries[key]
+
+    def put(self, key, value):
+        """Store value under key and flush it to disk immediately.
+
+        Returns:
+            The value in the JSON form it will have when read back.
+        """
+        value = to_jsonable(value)
+        with open(self.path, 'a') as f:
+            f.write(json.dumps({'key': key, 'value': value}) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        self._entries[key] = value
+        return value
+
+
+def _update_hash(h, value):
+    """Feed a value into a hash, covering array contents and types.
+
+    Numbers are hashed as float64 whether they arrive as Python scalars,
+    lists or integer arrays, since e.g. K=3 and K=3.0 describe the same
+    simulation.
+    """
+    if isinstance(value, (list, tuple)):
+        as_array = np.asarray(value) if value else None
+        if as_array is not None and as_array.dtype.kind in 'biuf':
+            value = as_array
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind in 'biuf':
+            value = value.astype(np.float64)
+        value = np.ascontiguousarray(value)
+        h.update(f"ndarray:{value.dtype.str}:{value.shape}:".encode())
+        h.update(value.tobytes())
+    elif hasattr(value, 'content_hash'):
+        h.update(f"{type(value).__name__}:{value.content_hash};".encode())
+    elif sparse.issparse(value):
+        csr = sparse.csr_array(value)
+        csr.sort_indices()
+        h.update(f"sparse:{csr.shape}:".encode())
+        for part in (csr.data, csr.indices, csr.indptr):
+            _update_hash(h, part)
+    elif isinstance(value, (bool, np.bool_)) or value is None:
+        h.update(f"{value!r};".encode())
+    elif isinstance(value, (int, float, np.integer, np.floating)):
+        h.update(f"num:{float(value)!r};".encode())
+    elif isinstance(value, (list, tuple)):
+        h.update(f"seq:{len(value)}:".encode())
+        for v in value:
+            _update_hash(h, v)
+    elif isinstance(value, dict):
+        h.update(f"dict:{len(value)}:".encode())
+        for k in sorted(value):
+            h.update(f"{k}=".encode())
+            _update_hash(h, value[k])
+    else:
+        h.update(f"{type(value).__name__}:{value!r};".encode())
+
+
+class SimulationCache:
+    """Persistent LRU memo of simulation results backed by SQLite.
+
+    Safe to share between the processes of a sweep: each process opens its
+    own connection and SQLite serializes the writes.
+
+    Args:
+        path: SQLite database file.
+        max_bytes: Budget for the pickled results; least recently used
+            entries are evicted beyond it.
+    """
+
+    def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._conn = None
+        self._pid = None
+
+    def __getstate__(self):
+        # Connections cannot cross process boundaries
+        return {'path': self.path, 'max_bytes': self.max_bytes,
+                '_conn': None, '_pid': None}
+
+    def _connection(self):
+        if self._conn is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, timeout=60)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, value BLOB, size INTEGER, "
+                "last_access REAL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS results_lru ON results(last_access)"
+            )
+            self._pid = os.getpid()
+        return self._conn
+
+    def key(self, fn, arguments):
+        """Hash a function together with its bound arguments."""
+        h = hashlib.sha256(f"{fn.__module__}.{fn.__qualname__}:".encode())
+        _update_hash(h, arguments)
+        return h.hexdigest()
+
+    def get(self, key):
+        """Return (True, value) on a hit and (False, None) on a miss."""
+        conn = self._connection()
+        row = conn.execute("SELECT value FROM results WHERE key = ?",
+                           (key,)).fetchone()
+        if row is None:
+            return False, None
+        with conn:
+            conn.execute("UPDATE results SET last_access = ? WHERE key = ?",
+                         (time.time(), key))
+        return True, pickle.loads(row[0])
+
+    def put(self, key, value):
+        """Store value under key and evict old entries beyond the budget."""
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        conn = self._connection()
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                         (key, blob, len(blob), time.time()))
+            total = conn.execute("SELECT SUM(size) FROM results").fetchone()[0]
+            while total > self.max_bytes:
+                oldest, size = conn.execute(
+                    "SELECT key, size FROM results ORDER BY last_access LIMIT 1"
+                ).fetchone()
+                conn.execute("DELETE FROM results WHERE key = ?", (oldest,))
+                total -= size
+
+    def memoize(self, fn):
+        """Wrap fn so repeated calls with identical inputs hit the cache."""
+        return MemoizedFunction(fn, self)
+
+
+class MemoizedFunction:
+    """Callable returned by ``SimulationCache.memoize``.
+
+    A class rather than a closure so that it can be sent to worker
+    processes. Calls without a seed and without an explicit initial state
+    draw random initial conditions and are never cached.
+    """
+
+    def __init__(self, fn, cache):
+        self.fn = fn
+        self.cache = cache
+        self.__module__ = fn.__module__
+        self.__qualname__ = fn.__qualname__
+        self.__name__ = fn.__name__
+        self.__doc__ = fn.__doc__
+
+    def __call__(self, *args, **kwargs):
+        bound = inspect.signature(self.fn).bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = bound.arguments
+
+        seeded = any(arguments.get(name) is not None
+                     for name in ('seed', 'seeds', 'theta0', 'z0'))
+        if not seeded:
+            return self.fn(*args, **kwargs)
+
+        key = self.cache.key(self.fn, arguments)
+        hit, value = self.cache.get(key)
+        if hit:
+            return value
+        value = self.fn(*args, **kwargs)
+        self.cache.put(key, value)
+        return value
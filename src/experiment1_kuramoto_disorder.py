@@ -21,11 +21,16 @@ import numpy as np
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
-from kuramoto import simulate_kuramoto, order_parameter
+from kuramoto import (
+    simulate_kuramoto_batch, order_parameter, find_threshold_crossing
+)
 from networks import (
     complete_graph, ring_graph, star_graph, path_graph,
-    cycle_graph, small_world_graph, get_topology_properties
+    cycle_graph, small_world_graph, get_topology_properties, node_degrees,
+    Topology
 )
+from sweep import run_sweep, task_seed
+from cache import CellCache, SimulationCache
 
 # ─── Configuration ─────────────────────────────────────────────────────────
 SEED = 42
@@ -38,6 +43,9 @@ DELTA = 1.0  # Disorder strength for uniform distribution
 
 RESULTS_DIR = Path(__file__).parent.parent / "results"
 RESULTS_DIR.mkdir(exist_ok=True)
+CELL_CACHE = RESULTS_DIR / "cache" / "experiment1_cells.jsonl"
+SIM_CACHE = SimulationCache(RESULTS_DIR / "cache" / "simulations.sqlite")
+simulate_kuramoto_batch = SIM_CACHE.memoize(simulate_kuramoto_batch)
 
 np.random.seed(SEED)
 
@@ -67,7 +75,7 @@ def generate_frequency_distributions(adj_matrix, N, delta=DELTA, seed=SEED):
     distributions['gaussian_disorder'] = make_zero_mean(omega_gauss)
 
     # Degree-correlated disorder: ω_i ∝ (d_i - d̄)
-    degrees = np.sum(adj_matrix, axis=1)
+    degrees = node_degrees(adj_matrix)
     omega_deg = degrees - np.mean(degrees)
     if np.max(np.abs(omega_deg)) > 0:
         omega_deg = delta * omega_deg / np.max(np.abs(omega_deg))
@@ -106,6 +114,18 @@ def run_topology_experiment(adj_matrix, topo_name):
         'distributions': {}
     }
 
+    # One task per (distribution, K): all trials of a cell form one batch
+    tasks = [
+        dict(omega=omega, K=K, adj_matrix=adj_matrix,
+             T=T_SIM, t_transient=T_TRANSIENT,
+             seeds=[task_seed(SEED, topo_name, dist_name, ki, trial)
+                    for trial in range(N_TRIALS)])
+        for dist_name, omega in distributions.items()
+        for ki, K in enumerate(K_VALUES)
+    ]
+    cell_results = iter(run_sweep(simulate_kuramoto_batch, tasks,
+                                  cache=CellCache(CELL_CACHE)))
+
     for dist_name, omega in distributions.items():
         print(f"\n  Distribution: {dist_name}")
         print(f"    ω range: [{omega.min():.3f}, {omega.max():.3f}], "
@@ -114,29 +134,13 @@ def run_topology_experiment(adj_matrix, topo_name):
         r_means = np.zeros(len(K_VALUES))
         r_stds = np.zeros(len(K_VALUES))
 
-        for ki, K in enumerate(K_VALUES):
-            trial_rs = np.zeros(N_TRIALS)
-            for trial in range(N_TRIALS):
-                trial_seed = SEED + hash((topo_name, dist_name, ki, trial)) % (2**31)
-                r_mean, _, _ = simulate_kuramoto(
-                    omega, K, adj_matrix,
-                    T=T_SIM, t_transient=T_TRANSIENT,
-                    seed=abs(trial_seed)
-                )
-                trial_rs[trial] = r_mean
+        for ki in range(len(K_VALUES)):
+            trial_rs, _, _ = next(cell_results)
             r_means[ki] = np.mean(trial_rs)
             r_stds[ki] = np.std(trial_rs)
 
         # Estimate critical coupling (r > 0.5 threshold)
-        above = r_means >= 0.5
-        if np.any(above):
-            idx = np.argmax(above)
-            if idx > 0:
-                K_c = np.interp(0.5, r_means[idx-1:idx+1], K_VALUES[idx-1:idx+1])
-            else:
-                K_c = K_VALUES[0]
-        else:
-            K_c = float('inf')
+        K_c = find_threshold_crossing(K_VALUES, r_means, 0.5)
 
         results['distributions'][dist_name] = {
             'omega': omega.tolist(),
@@ -165,6 +169,7 @@ def main():
         'path': path_graph(N),
         'small_world': small_world_graph(N, k=4, p=0.3, seed=42),
     }
+    topologies = {name: Topology(adj) for name, adj in topologies.items()}
 
     all_results = {}
     for name, adj in topologies.items():
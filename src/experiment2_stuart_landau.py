@@ -15,40 +15,206 @@ import numpy as np
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
-from stuart_landau import simulate_stuart_landau_ff
+from stuart_landau import (
+    simulate_stuart_landau_ff_batch, refine_locking_boundary
+)
+from sweep import run_sweep, task_seed
+from cache import CellCache, SimulationCache
 
 SEED = 42
 RESULTS_DIR = Path(__file__).parent.parent / "results"
 RESULTS_DIR.mkdir(exist_ok=True)
+CELL_CACHE = RESULTS_DIR / "cache" / "experiment2_cells.jsonl"
+SIM_CACHE = SimulationCache(RESULTS_DIR / "cache" / "simulations.sqlite")
+# Points per task when refining the locking boundary (one grid row of 2a)
+REFINE_CHUNK = 35
+# Quadtree depth of the optional adaptive boundary pass in 2a (0 = skip it;
+# depth 5 on a 9x9 coarse grid roughly triples the runtime of 2a)
+REFINE_DEPTH = 0
+# Solve chains with a unique, fast-attracting locked orbit instead of
+# integrating them (see simulate_stuart_landau_ff_batch); off by default
+# because its acceptance test ignores slow escapes and bistability
+LOCKED_SOLVER = False
+simulate_stuart_landau_ff_batch = SIM_CACHE.memoize(simulate_stuart_landau_ff_batch)
+
+
+def _feedforward_members(mu, omega, lam, seeds, T=150.0, t_transient=80.0,
+                         locked_solver=False):
+    """Integrate a batch of feedforward chains, one per seed.
+
+    With ``locked_solver``, chains with a unique, quickly attracting locked
+    orbit are solved directly instead of integrated. If the batched
+    integration fails, the members are rerun one at a time and a failing
+    member counts as unlocked with zero amplitude.
+
+    Returns:
+        locked: Phase-locking flag per member, shape (B,).
+        amplitudes: Mean output-node amplitude over the last 100 samples,
+            shape (B,).
+    """
+    try:
+        _, z, locked = simulate_stuart_landau_ff_batch(
+            mu, omega, lam, T=T, t_transient=t_transient,
+            seeds=seeds, n_keep=101, locked_solver=locked_solver
+        )
+        return locked, np.mean(np.abs(z[-100:, :, -1]), axis=0)
+    except RuntimeError:
+        pass
+
+    mu = np.broadcast_to(mu, (len(seeds), np.shape(mu)[-1]))
+    omega = np.broadcast_to(omega, mu.shape)
+    locked = np.zeros(len(seeds), dtype=bool)
+    amplitudes = np.zeros(len(seeds))
+    for b, trial_seed in enumerate(seeds):
+        try:
+            _, z, locked[b] = simulate_stuart_landau_ff_batch(
+                mu[b], omega[b], lam, T=T, t_transient=t_transient,
+                seeds=[trial_seed], n_keep=101,
+                locked_solver=locked_solver
+            )
+            amplitudes[b] = np.mean(np.abs(z[-100:, 0, -1]))
+        except RuntimeError:
+            pass
+    return locked, amplitudes
+
+
+def _solver_options():
+    """Extra task arguments selecting the locked solver.
+
+    Empty unless ``LOCKED_SOLVER`` is set, so the cell-cache keys of plain
+    runs do not change.
+    """
+    return {'locked_solver': True} if LOCKED_SOLVER else {}
+
+
+def feedforward_trials(mu, omega, lam, seeds, T=150.0, t_transient=80.0,
+                       locked_solver=False):
+    """Run one feedforward configuration from several initial conditions.
+
+    All trials are integrated together as one batch; ``locked_solver`` is
+    passed on to ``_feedforward_members``.
+
+    Returns:
+        lock_fraction: Fraction of trials that phase-locked.
+        amplitude: Mean output-node amplitude over the last 100 samples,
+            averaged over trials (failed integrations count as 0).
+    """
+    locked, amplitudes = _feedforward_members(
+        mu, omega, lam, seeds, T=T, t_transient=t_transient,
+        locked_solver=locked_solver
+    )
+    return float(np.mean(locked)), float(np.mean(amplitudes))
 
 
 def check_phase_locking_2cell(mu1, mu2, omega1, omega2, lam, n_trials=5, seed=42):
     """Check if 2-cell feedforward system achieves phase locking."""
-    mu = np.array([mu1, mu2])
-    omega = np.array([omega1, omega2])
-    locked_count = 0
-    amplitudes = []
+    return feedforward_trials(
+        np.array([mu1, mu2]), np.array([omega1, omega2]), lam,
+        seeds=[seed + trial for trial in range(n_trials)]
+    )
 
-    for trial in range(n_trials):
-        try:
-            t, z, locked = simulate_stuart_landau_ff(
-                mu, omega, lam, T=150.0, t_transient=80.0,
-                seed=seed + trial
-            )
-            if locked:
-                locked_count += 1
-            # Record final amplitude of output node
-            amplitudes.append(np.mean(np.abs(z[-100:, -1])))
-        except Exception:
-            amplitudes.append(0.0)
 
-    return locked_count / n_trials, np.mean(amplitudes) if amplitudes else 0.0
+def scan_row_2cell(mu1, mu2, sigma_vals, lam, n_trials, seed,
+                   locked_solver=False):
+    """Phase locking along one row (fixed μ₁, μ₂) of the (σ̃, μ̃) grid.
 
+    Every σ̃ and trial of the row is integrated as one batch. Cell j uses the
+    seeds ``check_phase_locking_2cell`` would use with ``seed + j``.
 
-def experiment_2a_phase_locking_boundary():
+    Returns:
+        lock: Lock fraction per σ̃, shape (n_sigma,).
+        amp: Output amplitude per σ̃, shape (n_sigma,).
+    """
+    n_sigma = len(sigma_vals)
+    return scan_points_2cell(np.full(n_sigma, mu1), np.full(n_sigma, mu2),
+                             sigma_vals, lam, n_trials,
+                             seed + np.arange(n_sigma), locked_solver)
+
+
+def scan_points_2cell(mu1, mu2, sigma_vals, lam, n_trials, point_seeds,
+                      locked_solver=False):
+    """Phase locking at arbitrary points (μ₁, μ₂, σ̃), integrated as one batch.
+
+    Point j uses the seeds ``check_phase_locking_2cell`` would use with
+    ``point_seeds[j]``. ``locked_solver`` is passed on to
+    ``_feedforward_members``.
+
+    Returns:
+        lock: Lock fraction per point, shape (P,).
+        amp: Output amplitude per point, shape (P,).
+    """
+    n_points = len(sigma_vals)
+    sig = np.repeat(sigma_vals, n_trials)
+    mu = np.repeat(np.column_stack([mu1, mu2]), n_trials, axis=0)
+    seeds = [s + trial for s in point_seeds for trial in range(n_trials)]
+    locked, amplitudes = _feedforward_members(
+        mu, np.column_stack([sig, -sig]), lam, seeds,
+        locked_solver=locked_solver
+    )
+    return (np.mean(locked.reshape(n_points, n_trials), axis=1),
+            np.mean(amplitudes.reshape(n_points, n_trials), axis=1))
+
+
+def _scan_grid(mu_pairs, sigma_vals, lam, n_trials, seed):
+    """Evaluate the 2-cell phase-locking grid, one parallel task per row.
+
+    Args:
+        mu_pairs: Sequence of (μ₁, μ₂) per row.
+        sigma_vals: Frequency mismatch per column.
+
+    Returns:
+        lock: Lock fractions, shape (len(mu_pairs), len(sigma_vals)).
+        amp: Output amplitudes, same shape.
+    """
+    n_sigma = len(sigma_vals)
+    tasks = [
+        dict(mu1=mu1, mu2=mu2, sigma_vals=sigma_vals, lam=lam,
+             n_trials=n_trials, seed=seed + i * n_sigma, **_solver_options())
+        for i, (mu1, mu2) in enumerate(mu_pairs)
+    ]
+    rows = run_sweep(scan_row_2cell, tasks, cache=CellCache(CELL_CACHE))
+    lock = np.array([row[0] for row in rows])
+    amp = np.array([row[1] for row in rows])
+    return lock, amp
+
+
+def _refine_grid(delta_mu, sigma_range, mu_range, lam, n_trials, seed,
+                 n_coarse, max_depth):
+    """Adaptive counterpart of ``_scan_grid`` with μ₁ = μ + δ, μ₂ = μ - δ.
+
+    The new points of each refinement level are split into parallel tasks
+    the size of a grid row. Point seeds derive from their lattice keys.
+
+    Returns:
+        sigma, mu, lock_fraction, area_fraction: See
+        ``stuart_landau.refine_locking_boundary``.
+    """
+    def evaluate(sigma, mu, keys):
+        chunks = np.array_split(np.arange(len(keys)),
+                                int(np.ceil(len(keys) / REFINE_CHUNK)))
+        tasks = [
+            dict(mu1=mu[c] + delta_mu, mu2=mu[c] - delta_mu,
+                 sigma_vals=sigma[c], lam=lam, n_trials=n_trials,
+                 point_seeds=seed + n_trials * keys[c], **_solver_options())
+            for c in chunks
+        ]
+        results = run_sweep(scan_points_2cell, tasks,
+                            cache=CellCache(CELL_CACHE))
+        return np.concatenate([lock for lock, _ in results])
+
+    return refine_locking_boundary(evaluate, sigma_range, mu_range,
+                                   n_coarse=n_coarse, max_depth=max_depth)
+
+
+def experiment_2a_phase_locking_boundary(refine_depth=REFINE_DEPTH):
     """Map the phase-locking boundary in (σ̃, μ̃) space for 2-cell network.
 
     Compare homogeneous (μ₁=μ₂) vs. heterogeneous (μ₁≠μ₂, mean preserved).
+
+    Args:
+        refine_depth: If positive, also refine both boundaries adaptively
+            from a 9x9 coarse grid to this depth and store the result
+            under 'adaptive'.
     """
     print("\n" + "=" * 60)
     print("Experiment 2a: Phase-locking boundary (2-cell feedforward)")
@@ -64,37 +230,18 @@ def experiment_2a_phase_locking_boundary():
 
     # Case 1: Homogeneous (μ₁ = μ₂ = μ)
     print("\n  Scanning homogeneous case (μ₁ = μ₂)...")
-    lock_homo = np.zeros((n_mu, n_sigma))
-    amp_homo = np.zeros((n_mu, n_sigma))
-
-    for i, mu_val in enumerate(mu_vals):
-        if i % 10 == 0:
-            print(f"    μ = {mu_val:.2f} ({i+1}/{n_mu})")
-        for j, sig_val in enumerate(sigma_vals):
-            frac, amp = check_phase_locking_2cell(
-                mu_val, mu_val, sig_val, -sig_val, lam,
-                n_trials=n_trials, seed=SEED + i * n_sigma + j
-            )
-            lock_homo[i, j] = frac
-            amp_homo[i, j] = amp
+    lock_homo, amp_homo = _scan_grid(
+        [(mu_val, mu_val) for mu_val in mu_vals], sigma_vals, lam,
+        n_trials=n_trials, seed=SEED
+    )
 
     # Case 2: Heterogeneous excitation (μ₁ = μ + δ, μ₂ = μ - δ, barycentric)
     delta_mu = 0.5  # Excitation mismatch
     print(f"\n  Scanning heterogeneous case (μ₁ = μ+{delta_mu}, μ₂ = μ-{delta_mu})...")
-    lock_hetero = np.zeros((n_mu, n_sigma))
-    amp_hetero = np.zeros((n_mu, n_sigma))
-
-    for i, mu_val in enumerate(mu_vals):
-        if i % 10 == 0:
-            print(f"    μ = {mu_val:.2f} ({i+1}/{n_mu})")
-        for j, sig_val in enumerate(sigma_vals):
-            frac, amp = check_phase_locking_2cell(
-                mu_val + delta_mu, mu_val - delta_mu,
-                sig_val, -sig_val, lam,
-                n_trials=n_trials, seed=SEED + 100000 + i * n_sigma + j
-            )
-            lock_hetero[i, j] = frac
-            amp_hetero[i, j] = amp
+    lock_hetero, amp_hetero = _scan_grid(
+        [(mu_val + delta_mu, mu_val - delta_mu) for mu_val in mu_vals],
+        sigma_vals, lam, n_trials=n_trials, seed=SEED + 100000
+    )
 
     results = {
         'sigma_vals': sigma_vals.tolist(),
@@ -121,6 +268,28 @@ def experiment_2a_phase_locking_boundary():
     results['area_homo'] = float(area_homo)
     results['area_hetero'] = float(area_hetero)
 
+    if refine_depth <= 0:
+        return results
+
+    # Same comparison with the boundary refined adaptively
+    n_coarse, max_depth = 9, refine_depth
+    print(f"\n  Refining boundaries (coarse {n_coarse}x{n_coarse}, "
+          f"depth {max_depth})...")
+    results['adaptive'] = {'n_coarse': n_coarse, 'max_depth': max_depth}
+    for name, delta, seed in [('homogeneous', 0.0, SEED + 200000),
+                              ('heterogeneous', delta_mu, SEED + 300000)]:
+        sigma, mu, lock, area = _refine_grid(
+            delta, (sigma_vals[0], sigma_vals[-1]), (mu_vals[0], mu_vals[-1]),
+            lam, n_trials, seed, n_coarse, max_depth
+        )
+        results['adaptive'][name] = {
+            'sigma': sigma.tolist(),
+            'mu': mu.tolist(),
+            'lock_fraction': lock.tolist(),
+            'area_fraction': float(area),
+        }
+        print(f"  Phase-locking area ({name}, {len(lock)} points): {area:.3f}")
+
     return results
 
 
@@ -148,29 +317,25 @@ def experiment_2b_amplitude_enhancement():
         'amplitude_curves': {}
     }
 
+    tasks = [
+        dict(mu=np.array([mu_base + delta_mu, mu_base - delta_mu]),
+             omega=np.array([sig, -sig]),  # barycentric frequencies
+             lam=lam, T=150.0, t_transient=80.0,
+             seeds=[SEED + int(delta_mu * 1000) + j * n_trials + trial
+                    for trial in range(n_trials)],
+             **_solver_options())
+        for delta_mu in delta_mu_values
+        for j, sig in enumerate(sigma_vals)
+    ]
+    cells = iter(run_sweep(feedforward_trials, tasks, cache=CellCache(CELL_CACHE)))
+
     for delta_mu in delta_mu_values:
         print(f"\n  δμ = {delta_mu:.2f}...")
         amps = np.zeros(len(sigma_vals))
         lock_frac = np.zeros(len(sigma_vals))
 
-        for j, sig in enumerate(sigma_vals):
-            trial_amps = []
-            locked = 0
-            for trial in range(n_trials):
-                try:
-                    t, z, is_locked = simulate_stuart_landau_ff(
-                        np.array([mu_base + delta_mu, mu_base - delta_mu]),
-                        np.array([sig, -sig]),  # barycentric frequencies
-                        lam, T=150.0, t_transient=80.0,
-                        seed=SEED + int(delta_mu * 1000) + j * n_trials + trial
-                    )
-                    trial_amps.append(np.mean(np.abs(z[-100:, -1])))
-                    if is_locked:
-                        locked += 1
-                except Exception:
-                    trial_amps.append(0.0)
-            amps[j] = np.mean(trial_amps)
-            lock_frac[j] = locked / n_trials
+        for j in range(len(sigma_vals)):
+            lock_frac[j], amps[j] = next(cells)
 
         results['amplitude_curves'][f'delta_mu_{delta_mu:.1f}'] = {
             'amplitudes': amps.tolist(),
@@ -212,6 +377,19 @@ def experiment_2c_three_cell():
         'configs': {}
     }
 
+    tasks = [
+        dict(mu=np.array([mu_base + d for d in deltas]),
+             # Barycentric frequencies: ω₁ + ω₂ + ω₃ = 0
+             omega=np.array([sig, 0, -sig]),
+             lam=lam, T=200.0, t_transient=100.0,
+             seeds=[task_seed(SEED, config_name) + j * n_trials + trial
+                    for trial in range(n_trials)],
+             **_solver_options())
+        for config_name, deltas in configs.items()
+        for j, sig in enumerate(sigma_vals)
+    ]
+    cells = iter(run_sweep(feedforward_trials, tasks, cache=CellCache(CELL_CACHE)))
+
     for config_name, deltas in configs.items():
         print(f"\n  Config: {config_name} δμ = {deltas}")
         mu_arr = np.array([mu_base + d for d in deltas])
@@ -220,27 +398,8 @@ def experiment_2c_three_cell():
         amps_out = np.zeros(len(sigma_vals))
         lock_frac = np.zeros(len(sigma_vals))
 
-        for j, sig in enumerate(sigma_vals):
-            # Barycentric frequencies: ω₁ + ω₂ + ω₃ = 0
-            omega_arr = np.array([sig, 0, -sig])
-
-            trial_amps = []
-            locked = 0
-            for trial in range(n_trials):
-                try:
-                    t, z, is_locked = simulate_stuart_landau_ff(
-                        mu_arr, omega_arr, lam,
-                        T=200.0, t_transient=100.0,
-                        seed=SEED + hash(config_name) % (2**31) + j * n_trials + trial
-                    )
-                    trial_amps.append(np.mean(np.abs(z[-100:, -1])))
-                    if is_locked:
-                        locked += 1
-                except Exception:
-                    trial_amps.append(0.0)
-
-            amps_out[j] = np.mean(trial_amps)
-            lock_frac[j] = locked / n_trials
+        for j in range(len(sigma_vals)):
+            lock_frac[j], amps_out[j] = next(cells)
 
         results['configs'][config_name] = {
             'deltas': deltas,
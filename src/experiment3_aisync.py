@@ -12,17 +12,70 @@ import sys
 import json
 import time
 import numpy as np
-import networkx as nx
+from math import comb
 from pathlib import Path
-from itertools import combinations
 
 sys.path.insert(0, str(Path(__file__).parent))
-from kuramoto import simulate_kuramoto, order_parameter
-from networks import laplacian_spectrum, spectral_gap_ratio
+from kuramoto import simulate_kuramoto_batch, order_parameter
+from networks import (
+    enumerate_circulant_graphs, laplacian_spectrum, spectral_gap_ratio
+)
+from sweep import run_sweep
+from cache import CellCache, SimulationCache
 
 SEED = 42
 RESULTS_DIR = Path(__file__).parent.parent / "results"
 RESULTS_DIR.mkdir(exist_ok=True)
+CELL_CACHE = RESULTS_DIR / "cache" / "experiment3_cells.jsonl"
+SIM_CACHE = SimulationCache(RESULTS_DIR / "cache" / "simulations.sqlite")
+simulate_kuramoto_batch = SIM_CACHE.memoize(simulate_kuramoto_batch)
+
+
+def _mobius(n):
+    """Möbius function μ(n) by trial division."""
+    result, p = 1, 2
+    while p * p <= n:
+        if n % p == 0:
+            n //= p
+            if n % p == 0:
+                return 0
+            result = -result
+        p += 1
+    return -result if n > 1 else result
+
+
+def _labeled_index(N, offsets):
+    """Position of an offset set among all connected offset sets of C_N.
+
+    The sets S ⊂ {1, ..., N//2} with gcd(N, S) = 1 are ordered by size,
+    then lexicographically. Instead of enumerating them, the sets before
+    ``offsets`` are counted with binomial sums, and the disconnected ones
+    are removed by Möbius inversion over the divisors d of N: the sets of
+    size r whose elements are all multiples of d number C(⌊M/d⌋, r).
+
+    Args:
+        N: Number of nodes.
+        offsets: Sorted connected offset set.
+
+    Returns:
+        Zero-based index in the labeled enumeration.
+    """
+    M = N // 2
+    mobius = {d: _mobius(d) for d in range(1, N + 1) if N % d == 0}
+    mobius = {d: mu for d, mu in mobius.items() if mu != 0}
+    r = len(offsets)
+    # Connected sets of smaller size
+    index = sum(mu * comb(M // d, size) for d, mu in mobius.items()
+                for size in range(1, r))
+    # Sets of size r that first differ from offsets at position i with a
+    # smaller element x, followed by any r - i - 1 elements above x
+    for i in range(r):
+        prefix = offsets[:i]
+        for x in range(offsets[i - 1] + 1 if i else 1, offsets[i]):
+            index += sum(mu * comb(M // d - x // d, r - i - 1)
+                         for d, mu in mobius.items()
+                         if x % d == 0 and all(s % d == 0 for s in prefix))
+    return index
 
 
 def generate_symmetric_graphs(N, max_graphs=200):
@@ -30,28 +83,23 @@ def generate_symmetric_graphs(N, max_graphs=200):
 
     For small N, these are circulant graphs. We enumerate circulant graphs
     as they are the main class of vertex-transitive graphs tractable to enumerate.
+    Connected circulants are enumerated up to multiplier isomorphism, so
+    relabeled copies of the same graph are simulated only once; the
+    multiplicity counts how many offset sets each one stands for.
+
+    The class representative is the first of its offset sets in the
+    labeled enumeration (by size, then lexicographically), and its position
+    there is returned as seed_index (``_labeled_index``) so it keeps the
+    seed it had when every offset set was simulated.
+
+    Returns:
+        List of (CirculantGraph, name, offsets, multiplicity, seed_index).
     """
     graphs = []
-    # Circulant graphs: C_N(S) where S ⊂ {1, ..., N//2}
-    possible_offsets = list(range(1, N // 2 + 1))
-    # Enumerate non-empty subsets of offsets
-    for r in range(1, len(possible_offsets) + 1):
-        for subset in combinations(possible_offsets, r):
-            G = nx.circulant_graph(N, list(subset))
-            adj = nx.to_numpy_array(G)
-            # Check it's connected
-            if nx.is_connected(G):
-                # Avoid duplicates (complete graph is reached multiple ways)
-                is_dup = False
-                for existing_adj, _, _ in graphs:
-                    if np.array_equal(adj, existing_adj):
-                        is_dup = True
-                        break
-                if not is_dup:
-                    name = f"C_{N}({','.join(map(str, subset))})"
-                    graphs.append((adj, name, list(subset)))
-            if len(graphs) >= max_graphs:
-                return graphs
+    for graph, multiplicity in enumerate_circulant_graphs(N, max_graphs):
+        name = f"C_{N}({','.join(map(str, graph.offsets))})"
+        graphs.append((graph, name, list(graph.offsets), multiplicity,
+                       _labeled_index(N, graph.offsets)))
     return graphs
 
 
@@ -74,14 +122,11 @@ def test_sync_with_msf_proxy(adj_matrix, N, is_heterogeneous=False,
     else:
         omega = np.zeros(N)
 
-    trial_rs = []
-    for trial in range(n_trials):
-        r_mean, _, _ = simulate_kuramoto(
-            omega, K, adj_matrix,
-            T=50.0, t_transient=25.0,
-            seed=seed + trial
-        )
-        trial_rs.append(r_mean)
+    trial_rs, _, _ = simulate_kuramoto_batch(
+        omega, K, adj_matrix,
+        T=50.0, t_transient=25.0,
+        seeds=seed + np.arange(n_trials)
+    )
 
     return np.mean(trial_rs), np.std(trial_rs)
 
@@ -125,30 +170,47 @@ def main():
 
     all_results = {}
 
+    max_graphs = 100
+
     # Test for N = 6, 8, 10 (small enough for enumeration)
     for N in [6, 8, 10]:
         print(f"\n{'='*50}")
         print(f"N = {N}: Enumerating symmetric (circulant) graphs...")
-        graphs = generate_symmetric_graphs(N, max_graphs=100)
-        print(f"  Found {len(graphs)} connected circulant graphs")
-
+        # One class beyond the cap tells whether the enumeration was cut off
+        graphs = generate_symmetric_graphs(N, max_graphs=max_graphs + 1)
+        truncated = len(graphs) > max_graphs
+        graphs = graphs[:max_graphs]
+        n_labeled = sum(multiplicity for *_, multiplicity, _ in graphs)
+        print(f"  Found {len(graphs)} connected circulant graphs "
+              f"up to isomorphism ({n_labeled} offset sets)")
+        if truncated:
+            print(f"  Stopped after {max_graphs} classes; fractions cover "
+                  f"only their offset sets")
+
+        # Counts over isomorphism classes, and over offset sets (each class
+        # weighted by its multiplicity) as when every offset set was simulated
         n_aisync = 0
         n_disorder_helps = 0
+        n_aisync_labeled = 0
+        n_disorder_helps_labeled = 0
         graph_results = []
 
         K_values = np.linspace(1.0, 15.0, 15)
 
-        for idx, (adj, name, offsets) in enumerate(graphs):
-            if idx % 5 == 0:
-                print(f"  Testing {name} ({idx+1}/{len(graphs)})...")
-
-            eigs = laplacian_spectrum(adj)
-            gap_ratio = spectral_gap_ratio(adj)
-
-            K_arr, r_homo, r_hetero = test_aisync_condition(
-                adj, N, name, K_values=K_values,
-                delta=0.5, n_trials=10, seed=SEED + idx * 1000
-            )
+        print(f"  Testing {len(graphs)} graphs in parallel...")
+        tasks = [
+            dict(adj_matrix=graph, N=N, name=name, K_values=K_values,
+                 delta=0.5, n_trials=10, seed=SEED + seed_idx * 1000)
+            for graph, name, offsets, _, seed_idx in graphs
+        ]
+        sweep_results = run_sweep(test_aisync_condition, tasks,
+                                  cache=CellCache(CELL_CACHE))
+
+        for (graph, name, offsets, multiplicity, _), result in zip(
+                graphs, sweep_results):
+            K_arr, r_homo, r_hetero = (np.asarray(v) for v in result)
+            eigs = laplacian_spectrum(graph)
+            gap_ratio = spectral_gap_ratio(graph)
 
             # Check AISync: hetero syncs better at some K where homo doesn't
             # "Disorder helps" = r_hetero > r_homo + 0.05 at some K
@@ -165,13 +227,16 @@ def main():
             if homo_max < 0.7 and hetero_max > 0.7:
                 is_aisync = True
                 n_aisync += 1
+                n_aisync_labeled += multiplicity
 
             if disorder_helps:
                 n_disorder_helps += 1
+                n_disorder_helps_labeled += multiplicity
 
             graph_results.append({
                 'name': name,
                 'offsets': offsets,
+                'multiplicity': multiplicity,
                 'spectral_gap_ratio': float(gap_ratio),
                 'laplacian_eigs': eigs.tolist(),
                 'r_homo': r_homo.tolist(),
@@ -182,21 +247,39 @@ def main():
                 'disorder_helps': bool(disorder_helps),
             })
 
+        # Top-level counts are offset sets (each class weighted by its
+        # multiplicity); 'classes' holds the same statistics per class
         all_results[f'N_{N}'] = {
             'N': N,
-            'n_graphs': len(graphs),
-            'n_aisync': n_aisync,
-            'n_disorder_helps': n_disorder_helps,
-            'aisync_fraction': n_aisync / len(graphs) if graphs else 0,
-            'disorder_helps_fraction': n_disorder_helps / len(graphs) if graphs else 0,
+            'n_graphs': n_labeled,
+            'n_aisync': n_aisync_labeled,
+            'n_disorder_helps': n_disorder_helps_labeled,
+            'aisync_fraction': n_aisync_labeled / n_labeled if graphs else 0,
+            'disorder_helps_fraction': n_disorder_helps_labeled / n_labeled if graphs else 0,
+            'classes': {
+                'n_graphs': len(graphs),
+                'n_aisync': n_aisync,
+                'n_disorder_helps': n_disorder_helps,
+                'aisync_fraction': n_aisync / len(graphs) if graphs else 0,
+                'disorder_helps_fraction': n_disorder_helps / len(graphs) if graphs else 0,
+            },
+            'max_graphs': max_graphs,
+            # If set, enumeration stopped at max_graphs classes and the
+            # fractions are over the offset sets of those classes only
+            'truncated': truncated,
             'K_values': K_values.tolist(),
             'graphs': graph_results,
         }
 
         print(f"\n  N={N} Summary:")
-        print(f"    Graphs tested: {len(graphs)}")
-        print(f"    AISync-like: {n_aisync} ({100*n_aisync/len(graphs):.1f}%)")
-        print(f"    Disorder helps: {n_disorder_helps} ({100*n_disorder_helps/len(graphs):.1f}%)")
+        print(f"    Graphs tested: {len(graphs)} classes ({n_labeled} offset sets)")
+        print(f"    AISync-like: {n_aisync_labeled}/{n_labeled} offset sets "
+              f"({100*n_aisync_labeled/n_labeled:.1f}%), "
+              f"{n_aisync}/{len(graphs)} classes ({100*n_aisync/len(graphs):.1f}%)")
+        print(f"    Disorder helps: {n_disorder_helps_labeled}/{n_labeled} offset sets "
+              f"({100*n_disorder_helps_labeled/n_labeled:.1f}%), "
+              f"{n_disorder_helps}/{len(graphs)} classes "
+              f"({100*n_disorder_helps/len(graphs):.1f}%)")
 
     outfile = RESULTS_DIR / "experiment3_aisync.json"
     with open(outfile, 'w') as f:
@@ -13,14 +13,20 @@ import json
 import time
 import numpy as np
 from scipy.optimize import minimize, differential_evolution
+from scipy.stats import spearmanr
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
-from kuramoto import simulate_kuramoto
+from kuramoto import simulate_kuramoto_batch
 from networks import (
     complete_graph, ring_graph, star_graph, path_graph,
-    small_world_graph, laplacian_spectrum, get_topology_properties
+    small_world_graph, laplacian_spectrum, get_topology_properties, Topology
 )
+from synchrony_alignment import (
+    laplacian_pseudoinverse, predicted_order_parameter, optimal_frequencies
+)
+from sweep import run_sweep, N_WORKERS
+from cache import CellCache, SimulationCache
 
 SEED = 42
 N = 12  # Moderate size for optimization
@@ -29,6 +35,10 @@ T_SIM = 50.0
 T_TRANSIENT = 25.0
 RESULTS_DIR = Path(__file__).parent.parent / "results"
 RESULTS_DIR.mkdir(exist_ok=True)
+# Shared by experiment4_quick.py and experiment4_optimal_disorder.py
+CELL_CACHE = RESULTS_DIR / "cache" / "experiment4_cells.jsonl"
+SIM_CACHE = SimulationCache(RESULTS_DIR / "cache" / "simulations.sqlite")
+simulate_kuramoto_batch = SIM_CACHE.memoize(simulate_kuramoto_batch)
 
 
 def evaluate_disorder(omega_free, adj_matrix, K, n_trials=N_TRIALS, seed=SEED):
@@ -39,21 +49,40 @@ def evaluate_disorder(omega_free, adj_matrix, K, n_trials=N_TRIALS, seed=SEED):
 
     Returns negative order parameter (for minimization).
     """
-    N = adj_matrix.shape[0]
-    omega = np.zeros(N)
-    omega[:N-1] = omega_free
-    omega[N-1] = -np.sum(omega_free)  # barycentric condition
-
-    trial_rs = []
-    for t in range(n_trials):
-        r_mean, _, _ = simulate_kuramoto(
-            omega, K, adj_matrix,
-            T=T_SIM, t_transient=T_TRANSIENT,
-            seed=seed + t
-        )
-        trial_rs.append(r_mean)
+    return evaluate_disorder_population(
+        np.reshape(omega_free, (-1, 1)), adj_matrix, K, n_trials, seed
+    )[0]
+
+
+def evaluate_disorder_population(omega_free, adj_matrix, K, n_trials=N_TRIALS,
+                                 seed=SEED):
+    """Vectorized ``evaluate_disorder`` for a whole DE population.
+
+    Every (solution, trial) pair becomes one member of a batched integration.
+    The population is split into one batch per sweep worker; trial t of
+    every solution uses seed + t, as ``evaluate_disorder`` does.
+
+    Args:
+        omega_free: Free frequencies, shape (N-1, S) as passed by
+            ``differential_evolution(vectorized=True)``.
 
-    return -np.mean(trial_rs)  # negative because we minimize
+    Returns:
+        Negative mean order parameter per solution, shape (S,).
+    """
+    omega_free = np.asarray(omega_free, dtype=float)
+    # barycentric condition fixes the Nth frequency
+    omega = np.vstack([omega_free, -np.sum(omega_free, axis=0)]).T
+
+    chunks = np.array_split(omega, min(N_WORKERS, len(omega)))
+    tasks = [
+        dict(omega=np.repeat(chunk, n_trials, axis=0), K=K,
+             adj_matrix=adj_matrix, T=T_SIM, t_transient=T_TRANSIENT,
+             seeds=np.tile(seed + np.arange(n_trials), len(chunk)))
+        for chunk in chunks
+    ]
+    trial_rs = np.concatenate([r_mean for r_mean, _, _ in
+                               run_sweep(simulate_kuramoto_batch, tasks)])
+    return -np.mean(trial_rs.reshape(-1, n_trials), axis=1)
 
 
 def optimize_disorder_for_topology(adj_matrix, topo_name, K, delta_max=2.0):
@@ -66,15 +95,18 @@ def optimize_disorder_for_topology(adj_matrix, topo_name, K, delta_max=2.0):
 
     print(f"  Optimizing disorder for {topo_name} at K={K:.2f}...")
 
+    # One batched integration per generation instead of one per trial
     result = differential_evolution(
-        evaluate_disorder,
+        evaluate_disorder_population,
         bounds,
         args=(adj_matrix, K),
         seed=SEED,
         maxiter=80,
         popsize=15,
         tol=1e-4,
-        disp=False
+        disp=False,
+        vectorized=True,
+        updating='deferred'
     )
 
     # Reconstruct full omega
@@ -118,27 +150,80 @@ def disorder_strength_sweep(adj_matrix, topo_name, K, n_strengths=20, seed=SEED)
     N_nodes = adj_matrix.shape[0]
     rng = np.random.default_rng(seed)
 
+    # Draw every disorder vector up front so the rng sequence is unchanged
+    tasks = []
     for i, delta in enumerate(delta_values):
         if delta == 0:
             omega = np.zeros(N_nodes)
         else:
             omega = rng.uniform(-delta, delta, N_nodes)
             omega -= np.mean(omega)  # barycentric
+        tasks.append(dict(omega=omega, K=K, adj_matrix=adj_matrix,
+                          T=T_SIM, t_transient=T_TRANSIENT,
+                          seeds=seed + i * N_TRIALS + np.arange(N_TRIALS)))
 
-        trial_rs = []
-        for t in range(N_TRIALS):
-            r_mean, _, _ = simulate_kuramoto(
-                omega, K, adj_matrix,
-                T=T_SIM, t_transient=T_TRANSIENT,
-                seed=seed + i * N_TRIALS + t
-            )
-            trial_rs.append(r_mean)
+    cells = run_sweep(simulate_kuramoto_batch, tasks, cache=CellCache(CELL_CACHE))
+    for i, (trial_rs, _, _) in enumerate(cells):
         r_values[i] = np.mean(trial_rs)
         r_stds[i] = np.std(trial_rs)
 
     return delta_values, r_values, r_stds
 
 
+def screen_disorder_candidates(adj_matrix, topo_name, K, delta,
+                               n_candidates=2000, n_validate=5, seed=SEED):
+    """Rank disorder vectors with the synchrony alignment function.
+
+    Draws n_candidates uniform zero-mean vectors on [-δ, δ] and rescales
+    them to the common norm δ√(N/3) (the expected norm of such a draw),
+    since the SAF only compares vectors of equal norm. The SAF optimum of
+    that norm is added as well. Only the n_validate best-ranked vectors and
+    the first n_validate random draws, as a control, are simulated, with
+    the same N_TRIALS initial conditions each.
+    """
+    N_nodes = adj_matrix.shape[0]
+    norm = delta * np.sqrt(N_nodes / 3)
+    rng = np.random.default_rng(seed)
+    candidates = rng.uniform(-delta, delta, (n_candidates, N_nodes))
+    candidates -= candidates.mean(axis=1, keepdims=True)  # barycentric
+    candidates *= norm / np.linalg.norm(candidates, axis=1, keepdims=True)
+    candidates = np.vstack([candidates, optimal_frequencies(adj_matrix, norm)])
+
+    r_pred = predicted_order_parameter(candidates, K, adj_matrix,
+                                       laplacian_pseudoinverse(adj_matrix))
+    best = np.argsort(-r_pred)[:n_validate]
+    control = np.arange(n_validate)
+    validate = np.concatenate([best, control])
+
+    tasks = [dict(omega=candidates[i], K=K, adj_matrix=adj_matrix,
+                  T=T_SIM, t_transient=T_TRANSIENT,
+                  seeds=seed + np.arange(N_TRIALS))
+             for i in validate]
+    cells = run_sweep(simulate_kuramoto_batch, tasks, cache=CellCache(CELL_CACHE))
+    r_sim = np.array([np.mean(trial_rs) for trial_rs, _, _ in cells])
+    # On the complete graph every vector of a given norm scores the same
+    rho = (spearmanr(r_pred[validate], r_sim)[0]
+           if np.ptp(r_pred[validate]) > 1e-12 else np.nan)
+
+    print(f"  {topo_name} at K={K:.1f}, δ={delta:.3f}: "
+          f"SAF-ranked r = {np.mean(r_sim[:n_validate]):.4f}, "
+          f"random r = {np.mean(r_sim[n_validate:]):.4f}, "
+          f"rank correlation {rho:.2f}")
+
+    return {
+        'K': K,
+        'delta': float(delta),
+        'norm': float(norm),
+        'n_candidates': n_candidates + 1,
+        'omega_best': candidates[best[0]].tolist(),
+        'r_predicted_best': r_pred[best].tolist(),
+        'r_simulated_best': r_sim[:n_validate].tolist(),
+        'r_predicted_random': r_pred[control].tolist(),
+        'r_simulated_random': r_sim[n_validate:].tolist(),
+        'rank_correlation': float(rho),
+    }
+
+
 def main():
     start_time = time.time()
     print("=" * 60)
@@ -154,6 +239,8 @@ def main():
         'path': path_graph(N),
         'small_world': small_world_graph(N, k=4, p=0.3, seed=42),
     }
+    # The SAF screening reuses each graph's memoized L⁺ and eigenvectors
+    topologies = {name: Topology(adj) for name, adj in topologies.items()}
 
     all_results = {
         'optimization': {},
@@ -196,6 +283,19 @@ def main():
             'homo_r': float(r_vals[0]),
         }
 
+    # Part C (cheap, so before B): surrogate screening at the best strength
+    print("\n" + "="*50)
+    print("Part C: Synchrony Alignment Screening")
+    print("="*50)
+
+    all_results['saf_screening'] = {}
+    for name, adj in topologies.items():
+        sweep = all_results['strength_sweep'][name]
+        delta = sweep['best_delta'] or sweep['delta_values'][1]
+        all_results['saf_screening'][name] = screen_disorder_candidates(
+            adj, name, K_test[name], delta
+        )
+
     # Part B: Full optimization for topologies where disorder helps
     print("\n" + "="*50)
     print("Part B: Optimal Distribution Search")
@@ -10,10 +10,12 @@ import numpy as np
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
-from kuramoto import simulate_kuramoto
+from kuramoto import simulate_kuramoto_batch
+from sweep import run_sweep
+from cache import CellCache, SimulationCache
 from networks import (
     complete_graph, ring_graph, star_graph, path_graph,
-    small_world_graph
+    small_world_graph, Topology
 )
 
 SEED = 42
@@ -23,6 +25,10 @@ T_SIM = 50.0
 T_TRANSIENT = 25.0
 RESULTS_DIR = Path(__file__).parent.parent / "results"
 RESULTS_DIR.mkdir(exist_ok=True)
+# Shared by experiment4_quick.py and experiment4_optimal_disorder.py
+CELL_CACHE = RESULTS_DIR / "cache" / "experiment4_cells.jsonl"
+SIM_CACHE = SimulationCache(RESULTS_DIR / "cache" / "simulations.sqlite")
+simulate_kuramoto_batch = SIM_CACHE.memoize(simulate_kuramoto_batch)
 
 
 def disorder_strength_sweep(adj_matrix, topo_name, K, n_strengths=20, seed=SEED):
@@ -32,21 +38,20 @@ def disorder_strength_sweep(adj_matrix, topo_name, K, n_strengths=20, seed=SEED)
     N_nodes = adj_matrix.shape[0]
     rng = np.random.default_rng(seed)
 
+    # Draw every disorder vector up front so the rng sequence is unchanged
+    tasks = []
     for i, delta in enumerate(delta_values):
         if delta == 0:
             omega = np.zeros(N_nodes)
         else:
             omega = rng.uniform(-delta, delta, N_nodes)
             omega -= np.mean(omega)
+        tasks.append(dict(omega=omega, K=K, adj_matrix=adj_matrix,
+                          T=T_SIM, t_transient=T_TRANSIENT,
+                          seeds=seed + i * N_TRIALS + np.arange(N_TRIALS)))
 
-        trial_rs = []
-        for t in range(N_TRIALS):
-            r_mean, _, _ = simulate_kuramoto(
-                omega, K, adj_matrix,
-                T=T_SIM, t_transient=T_TRANSIENT,
-                seed=seed + i * N_TRIALS + t
-            )
-            trial_rs.append(r_mean)
+    cells = run_sweep(simulate_kuramoto_batch, tasks, cache=CellCache(CELL_CACHE))
+    for i, (trial_rs, _, _) in enumerate(cells):
         r_values[i] = np.mean(trial_rs)
         r_stds[i] = np.std(trial_rs)
 
@@ -63,6 +68,7 @@ def main():
         'path': path_graph(N),
         'small_world': small_world_graph(N, k=4, p=0.3, seed=42),
     }
+    topologies = {name: Topology(adj) for name, adj in topologies.items()}
 
     K_test = {
         'complete': 2.0, 'ring_k1': 5.0, 'ring_k2': 3.0,
@@ -18,12 +18,17 @@ from scipy import stats
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
-from kuramoto import simulate_kuramoto, order_parameter, kuramoto_rhs
-from networks import ring_graph, laplacian_spectrum
+from kuramoto import simulate_kuramoto_batch
+from networks import ring_graph
+from sweep import run_sweep
+from cache import CellCache, SimulationCache
 
 SEED = 42
 RESULTS_DIR = Path(__file__).parent.parent / "results"
 RESULTS_DIR.mkdir(exist_ok=True)
+CELL_CACHE = RESULTS_DIR / "cache" / "experiment5_cells.jsonl"
+SIM_CACHE = SimulationCache(RESULTS_DIR / "cache" / "simulations.sqlite")
+simulate_kuramoto_batch = SIM_CACHE.memoize(simulate_kuramoto_batch)
 
 
 def scan_K_delta_space(N, k_ring=1, n_K=30, n_delta=25, n_trials=20,
@@ -40,28 +45,29 @@ def scan_K_delta_space(N, k_ring=1, n_K=30, n_delta=25, n_trials=20,
     r_grid = np.zeros((n_K, n_delta))
     r_std_grid = np.zeros((n_K, n_delta))
 
+    tasks = []
     for i, K in enumerate(K_vals):
-        if i % 5 == 0:
-            print(f"  K = {K:.2f} ({i+1}/{n_K})")
         for j, delta in enumerate(delta_vals):
-            trial_rs = []
+            omegas = np.zeros((n_trials, N))
             for trial in range(n_trials):
                 rng = np.random.default_rng(SEED + i * n_delta * n_trials + j * n_trials + trial)
-                if delta == 0:
-                    omega = np.zeros(N)
-                else:
-                    omega = rng.uniform(-delta, delta, N)
-                    omega -= np.mean(omega)  # barycentric condition
-
-                r_mean, _, _ = simulate_kuramoto(
-                    omega, K, adj,
-                    T=50.0, t_transient=25.0,
-                    seed=SEED + i * 10000 + j * 100 + trial
-                )
-                trial_rs.append(r_mean)
-
-            r_grid[i, j] = np.mean(trial_rs)
-            r_std_grid[i, j] = np.std(trial_rs)
+                if delta != 0:
+                    omegas[trial] = rng.uniform(-delta, delta, N)
+                    omegas[trial] -= np.mean(omegas[trial])  # barycentric condition
+
+            # One batched integration per (K, δ) cell
+            tasks.append(dict(
+                omega=omegas, K=K, adj_matrix=adj,
+                T=50.0, t_transient=25.0,
+                seeds=SEED + i * 10000 + j * 100 + np.arange(n_trials)
+            ))
+
+    print(f"  Running {len(tasks)} (K, δ) cells...")
+    cells = run_sweep(simulate_kuramoto_batch, tasks, cache=CellCache(CELL_CACHE))
+    for cell, (trial_rs, _, _) in enumerate(cells):
+        i, j = divmod(cell, n_delta)
+        r_grid[i, j] = np.mean(trial_rs)
+        r_std_grid[i, j] = np.std(trial_rs)
 
     return K_vals, delta_vals, r_grid, r_std_grid
 
@@ -73,22 +79,19 @@ def statistical_test_disorder_enhancement(N, k_ring, K, delta, n_trials=100):
     """
     adj = ring_graph(N, k=k_ring)
 
-    r_homo = np.zeros(n_trials)
-    r_hetero = np.zeros(n_trials)
-
     omega_homo = np.zeros(N)
+    omega_hetero = np.zeros((n_trials, N))
 
     for trial in range(n_trials):
         rng = np.random.default_rng(SEED + trial * 2)
-        omega_hetero = rng.uniform(-delta, delta, N)
-        omega_hetero -= np.mean(omega_hetero)
+        omega_hetero[trial] = rng.uniform(-delta, delta, N)
+        omega_hetero[trial] -= np.mean(omega_hetero[trial])
 
-        r_h, _, _ = simulate_kuramoto(omega_homo, K, adj, T=60.0, t_transient=30.0,
-                                       seed=SEED + trial)
-        r_het, _, _ = simulate_kuramoto(omega_hetero, K, adj, T=60.0, t_transient=30.0,
-                                         seed=SEED + trial)  # same IC
-        r_homo[trial] = r_h
-        r_hetero[trial] = r_het
+    trial_seeds = SEED + np.arange(n_trials)
+    r_homo, _, _ = simulate_kuramoto_batch(omega_homo, K, adj, T=60.0, t_transient=30.0,
+                                           seeds=trial_seeds)
+    r_hetero, _, _ = simulate_kuramoto_batch(omega_hetero, K, adj, T=60.0, t_transient=30.0,
+                                             seeds=trial_seeds)  # same IC
 
     # Paired t-test (same initial conditions)
     t_stat, p_value = stats.ttest_rel(r_hetero, r_homo)
@@ -164,11 +167,15 @@ def main():
         (20, 1, 3.0, 0.3),  # ring_k1, N=20, different K
     ]
 
+    tasks = [dict(N=N, k_ring=k, K=K, delta=delta, n_trials=80)
+             for N, k, K, delta in test_configs]
+    test_results = run_sweep(statistical_test_disorder_enhancement, tasks,
+                             cache=CellCache(CELL_CACHE))
+
     stat_results = {}
-    for N, k, K, delta in test_configs:
+    for (N, k, K, delta), result in zip(test_configs, test_results):
         key = f"ring_k{k}_N{N}_K{K:.1f}_d{delta:.1f}"
         print(f"\n  Testing {key}...")
-        result = statistical_test_disorder_enhancement(N, k, K, delta, n_trials=80)
         stat_results[key] = result
         sig = "***" if result['p_value'] < 0.001 else "**" if result['p_value'] < 0.01 else "*" if result['p_value'] < 0.05 else "ns"
         print(f"    r_homo={result['r_homo_mean']:.4f}±{result['r_homo_std']:.4f}, "
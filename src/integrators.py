@@ -0,0 +1,290 @@
+"""
+ODE integration helpers shared by the oscillator simulators.
+
+``integrate_streaming`` samples the trajectory every dt, like ``solve_ivp``
+with ``t_eval``, but hands each block of samples to an observer and keeps
+nothing, so memory stays O(n) however long the run is.
+
+It accepts the adaptive ``solve_ivp`` methods (default RK45 with rtol=1e-8,
+atol=1e-10) and the fixed-step explicit Euler, Heun and classical RK4
+schemes. The adaptive run is far more accurate than a time-averaged order
+parameter needs; the fixed-step schemes keep the state and every stage in
+preallocated buffers.
+
+Right-hand sides use the ``solve_ivp`` convention ``fun(t, y, *args)``, so
+the same kernels drive every path. The implicit methods (Radau, BDF, LSODA)
+can be given an analytic Jacobian ``jac(t, y, *args)`` with the same
+arguments; without one they estimate it by finite differences, optionally
+restricted to a ``jac_sparsity`` pattern.
+"""
+
+import numpy as np
+from scipy import sparse
+from scipy.integrate import RK23, RK45, DOP853, Radau, BDF, LSODA
+
+FIXED_STEP_METHODS = ('euler', 'heun', 'rk4')
+ADAPTIVE_METHODS = {
+    'RK23': RK23, 'RK45': RK45, 'DOP853': DOP853,
+    'Radau': Radau, 'BDF': BDF, 'LSODA': LSODA,
+}
+# Methods that use a Jacobian; the others ignore jac and jac_sparsity
+IMPLICIT_METHODS = ('Radau', 'BDF', 'LSODA')
+
+# Samples collected before a fixed-step run flushes them to the observer
+STREAM_CHUNK = 256
+
+
+def integrate_streaming(fun, t_span, y0, dt, observer, method='RK45',
+                        args=(), rtol=1e-8, atol=1e-10, jac=None,
+                        jac_sparsity=None):
+    """Integrate an ODE, passing samples to an observer instead of storing them.
+
+    The samples are taken on the grid ``np.arange(t_span[0], t_span[1], dt)``
+    and, for adaptive methods, come from the same dense-output interpolant
+    ``solve_ivp`` uses for ``t_eval``, so an observer sees exactly the values
+    ``solve_ivp`` would have returned there.
+
+    Args:
+        fun: Right-hand side ``fun(t, y, *args)``.
+        t_span: (t0, t1) integration interval.
+        y0: Initial state, shape (n,).
+        dt: Output time step (and step size for fixed-step methods).
+        observer: Callable ``observer(t, y)`` receiving consecutive blocks of
+            samples, t of shape (k,) and y of shape (n, k). If it returns a
+            true value the integration stops after that block.
+        method: 'euler', 'heun', 'rk4' or a ``solve_ivp`` method name.
+        args: Extra positional arguments passed to fun.
+        rtol, atol: Tolerances for adaptive methods.
+        jac: Jacobian ``jac(t, y, *args)``, dense or sparse, used by the
+            implicit methods.
+        jac_sparsity: Sparsity pattern of the Jacobian for finite-difference
+            estimates when jac is None (Radau and BDF only).
+
+    Returns:
+        y_last: State at the last output time passed to the observer,
+            shape (n,).
+    """
+    t_out = np.arange(t_span[0], t_span[1], dt)
+
+    if method in FIXED_STEP_METHODS:
+        chunk = np.empty((np.size(y0), min(STREAM_CHUNK, len(t_out))))
+        start = 0
+        for n, y in enumerate(_fixed_steps(fun, y0, t_out, dt, method, args)):
+            chunk[:, n - start] = y
+            if n - start + 1 == chunk.shape[1] or n == len(t_out) - 1:
+                if observer(t_out[start:n + 1], chunk[:, :n - start + 1]):
+                    break
+                start = n + 1
+        return y.copy()
+
+    if method not in ADAPTIVE_METHODS:
+        raise ValueError(f"Unknown integration method {method!r}")
+
+    solver = ADAPTIVE_METHODS[method](
+        lambda t, y: fun(t, y, *args), t_span[0], np.asarray(y0, dtype=float),
+        t_span[1], rtol=rtol, atol=atol,
+        **_jacobian_options(method, args, jac, jac_sparsity)
+    )
+    i = 0
+    y_last = np.asarray(y0, dtype=float)
+    while solver.status == 'running':
+        message = solver.step()
+        if solver.status == 'failed':
+            raise RuntimeError(f"Integration failed: {message}")
+        # Emit every output time passed by this step
+        i_new = np.searchsorted(t_out, solver.t, side='right')
+        if i_new > i:
+            y_step = solver.dense_output()(t_out[i:i_new])
+            y_last = y_step[:, -1]
+            if observer(t_out[i:i_new], y_step):
+                break
+            i = i_new
+    return y_last
+
+
+def _jacobian_options(method, args, jac, jac_sparsity):
+    """Solver keyword arguments carrying the Jacobian, if the method uses it."""
+    options = {}
+    if method not in IMPLICIT_METHODS:
+        return options
+    if jac is not None:
+        if method == 'LSODA':
+            # LSODA only accepts dense Jacobians
+            options['jac'] = lambda t, y: _dense(jac(t, y, *args))
+        else:
+            options['jac'] = lambda t, y: jac(t, y, *args)
+    elif jac_sparsity is not None and method != 'LSODA':
+        options['jac_sparsity'] = jac_sparsity
+    return options
+
+
+def _dense(matrix):
+    return matrix.toarray() if sparse.issparse(matrix) else matrix
+
+
+class TrajectoryRecorder:
+    """Observer that keeps the sampled trajectory from t_start onwards.
+
+    With ``max_samples`` only the most recent samples are retained, so a run
+    that only needs the tail of its trajectory uses O(n * max_samples)
+    memory.
+
+    Args:
+        t_start: Samples with t < t_start are dropped.
+        max_samples: Number of most recent samples to keep; None keeps all.
+    """
+
+    def __init__(self, t_start=-np.inf, max_samples=None):
+        self.t_start = t_start
+        self.max_samples = max_samples
+        self._t = []
+        self._y = []
+        self._count = 0
+
+    def __call__(self, t, y):
+        keep = t >= self.t_start
+        if not np.any(keep):
+            return
+        self._t.append(t[keep])
+        self._y.append(y[:, keep])  # boolean indexing copies the block
+        self._count += int(np.sum(keep))
+        if self.max_samples is not None and self._count > 2 * self.max_samples:
+            self._trim()
+
+    def _trim(self):
+        if not self._t:
+            return
+        self._t = [np.concatenate(self._t)[-self.max_samples:]]
+        self._y = [np.concatenate(self._y, axis=1)[:, -self.max_samples:]]
+        self._count = len(self._t[0])
+
+    @property
+    def t(self):
+        """Recorded times, shape (T,)."""
+        if self.max_samples is not None:
+            self._trim()
+        return np.concatenate(self._t) if self._t else np.empty(0)
+
+    @property
+    def y(self):
+        """Recorded states, shape (n, T)."""
+        if self.max_samples is not None:
+            self._trim()
+        return np.concatenate(self._y, axis=1) if self._y else np.empty((0, 0))
+
+
+class StationarityTracker:
+    """Track how long a set of signals has stayed inside a tolerance band.
+
+    Fed block by block, it keeps the current stretch of samples over which
+    every signal's peak-to-peak range is at most ``tol``, together with the
+    per-signal mean and variance over that stretch. A block that breaks the
+    band starts a new stretch (from that block, if it fits the band on its
+    own), so the stretch is tracked to block granularity without storing
+    any samples.
+
+    Args:
+        tol: Largest allowed peak-to-peak range of each signal.
+    """
+
+    def __init__(self, tol):
+        self.tol = tol
+        self.t_start = None
+        self.count = 0
+
+    def update(self, t, x):
+        """Add a block of samples and return the length of the stretch.
+
+        Args:
+            t: Sample times, shape (k,).
+            x: Signal values, shape (m, k).
+
+        Returns:
+            Time from the first to the last sample of the current stretch,
+            0.0 if there is none.
+        """
+        lo = np.min(x, axis=1)
+        hi = np.max(x, axis=1)
+        mean_block = np.mean(x, axis=1)
+        m2_block = np.sum((x - mean_block[:, np.newaxis])**2, axis=1)
+
+        if self.t_start is not None:
+            lo_new = np.minimum(self.lo, lo)
+            hi_new = np.maximum(self.hi, hi)
+            if np.all(hi_new - lo_new <= self.tol):
+                self.lo, self.hi = lo_new, hi_new
+                total = self.count + x.shape[1]
+                delta = mean_block - self.mean
+                self.mean = self.mean + delta * x.shape[1] / total
+                self.m2 = (self.m2 + m2_block
+                           + delta**2 * self.count * x.shape[1] / total)
+                self.count = total
+                return t[-1] - self.t_start
+
+        if np.all(hi - lo <= self.tol):
+            self.t_start = t[0]
+            self.lo, self.hi = lo, hi
+            self.count, self.mean, self.m2 = x.shape[1], mean_block, m2_block
+            return t[-1] - t[0]
+
+        self.t_start = None
+        self.count = 0
+        return 0.0
+
+    @property
+    def var(self):
+        """Population variance of each signal over the stretch."""
+        return self.m2 / self.count
+
+
+def _fixed_steps(fun, y0, t_out, dt, method, args):
+    """Advance a fixed-step scheme and yield the state at each output time.
+
+    The yielded array is the integrator's own state buffer; callers must copy
+    it if they keep it past the next iteration.
+    """
+    if method not in FIXED_STEP_METHODS:
+        raise ValueError(f"Unknown fixed-step method {method!r}; "
+                         f"expected one of {FIXED_STEP_METHODS}")
+
+    h = dt
+    y = np.array(y0, dtype=float)
+    # Stage and workspace buffers, reused for every step
+    k1 = np.empty_like(y)
+    k2 = np.empty_like(y)
+    k3 = np.empty_like(y)
+    k4 = np.empty_like(y)
+    work = np.empty_like(y)
+
+    for n, t in enumerate(t_out):
+        yield y
+        if n == len(t_out) - 1:
+            break
+        k1[:] = fun(t, y, *args)
+        if method == 'euler':
+            k1 *= h
+            y += k1
+        elif method == 'heun':
+            np.multiply(k1, h, out=work)
+            work += y
+            k2[:] = fun(t + h, work, *args)
+            k1 += k2
+            k1 *= h / 2
+            y += k1
+        else:
+            np.multiply(k1, h / 2, out=work)
+            work += y
+            k2[:] = fun(t + h / 2, work, *args)
+            np.multiply(k2, h / 2, out=work)
+            work += y
+            k3[:] = fun(t + h / 2, work, *args)
+            np.multiply(k3, h, out=work)
+            work += y
+            k4[:] = fun(t + h, work, *args)
+            # y += h/6 (k1 + 2 k2 + 2 k3 + k4)
+            k2 += k3
+            k2 *= 2
+            k1 += k2
+            k1 += k4
+            k1 *= h / 6
+            y += k1
@@ -2,71 +2,391 @@
 Network topology generation for synchronization experiments.
 
 Provides adjacency matrices for various canonical network topologies,
-along with their Laplacian spectra.
+along with their Laplacian spectra. Matrices are assembled directly from
+edge lists, in O(E) time and memory for the sparse format; networkx is
+only imported by ``networkx_adjacency`` to cross-check them.
 """
 
+import hashlib
+import random
+from itertools import combinations
+from math import gcd
+
 import numpy as np
-import networkx as nx
+from scipy.sparse import (
+    coo_array, csc_array, csr_array, diags_array, eye_array, issparse
+)
+from scipy.sparse.csgraph import connected_components, reverse_cuthill_mckee
+from scipy.sparse.linalg import LinearOperator, eigsh, splu
+
+# Circulant graphs with at least this many distinct neighbor shifts multiply
+# by FFT instead of summing shifted copies
+CIRCULANT_FFT_MIN_SHIFTS = 16
+
+# Laplacian eigenvalues below this count as zero modes
+ZERO_EIGENVALUE_TOL = 1e-10
+
+# Spectral diagnostics of larger graphs use sparse Lanczos iterations
+# instead of a dense eigendecomposition
+DENSE_SPECTRUM_MAX_NODES = 2000
+
+# Graphs whose reverse Cuthill-McKee bandwidth is at most this get their
+# spectral gap by shift-invert Lanczos; wider ones would fill in the LU factors
+SHIFT_INVERT_MAX_BANDWIDTH = 32
+
+
+def _from_edges(N, u, v, sparse=False):
+    """Symmetric 0/1 adjacency matrix of the undirected edges (u[e], v[e]).
+
+    Repeated edges collapse to one; u[e] == v[e] gives a self-loop.
+    """
+    u = np.asarray(u, dtype=np.int64)
+    v = np.asarray(v, dtype=np.int64)
+    if not sparse:
+        A = np.zeros((N, N))
+        A[u, v] = 1
+        A[v, u] = 1
+        return A
+    A = csr_array(coo_array(
+        (np.ones(2 * len(u)), (np.concatenate([u, v]), np.concatenate([v, u]))),
+        shape=(N, N)
+    ))
+    A.data[:] = 1
+    return A
 
 
-def complete_graph(N):
+def complete_graph(N, sparse=False):
     """Complete graph K_N (all-to-all coupling)."""
-    G = nx.complete_graph(N)
-    return nx.to_numpy_array(G)
+    if not sparse:
+        return np.ones((N, N)) - np.eye(N)
+    u, v = np.triu_indices(N, k=1)
+    return _from_edges(N, u, v, sparse)
 
 
-def ring_graph(N, k=1):
+def ring_graph(N, k=1, sparse=False):
     """Ring graph with k nearest-neighbor connections on each side.
 
     k=1: simple ring (each node connected to 2 neighbors)
     k=2: each node connected to 4 neighbors, etc.
+
+    With sparse=True a CSR array is returned, which is what large-N
+    simulations should use.
     """
-    G = nx.circulant_graph(N, list(range(1, k + 1)))
-    return nx.to_numpy_array(G)
+    return circulant_graph(N, list(range(1, k + 1)), sparse)
 
 
-def star_graph(N):
+def star_graph(N, sparse=False):
     """Star graph: one hub connected to N-1 leaves.
 
     Node 0 is the hub.
     """
-    G = nx.star_graph(N - 1)
-    return nx.to_numpy_array(G)
+    leaves = np.arange(1, N)
+    return _from_edges(N, np.zeros_like(leaves), leaves, sparse)
 
 
-def circulant_graph(N, offsets):
+def circulant_graph(N, offsets, sparse=False):
     """Circulant graph C_N(offsets).
 
     Args:
         N: Number of nodes.
         offsets: List of connection offsets (positive integers).
+        sparse: Return a CSR array instead of a dense one.
+    """
+    nodes = np.arange(N)
+    u = np.tile(nodes, len(offsets))
+    v = (u + np.repeat(np.asarray(offsets, dtype=np.int64), N)) % N
+    return _from_edges(N, u, v, sparse)
+
+
+class CirculantGraph:
+    """Circulant graph C_N(offsets), stored as its offsets only.
+
+    Node i is linked to i ± s (mod N) for every offset s, so A_ij depends
+    only on (j - i) mod N and A acts on a vector as a cyclic convolution.
+    ``A @ x`` is computed from shifted slices in O(N |S|), or by FFT in
+    O(N log N) for wide offset sets, and the Kuramoto and Stuart-Landau
+    kernels use it without ever forming the N x N matrix. Code that needs
+    the matrix itself gets it from ``np.asarray`` or ``toarray``, which only
+    makes sense for small N.
+
+    Args:
+        N: Number of nodes.
+        offsets: Connection offsets, nonzero modulo N. Equivalent offsets
+            (s, N - s, s + N) are merged.
     """
-    G = nx.circulant_graph(N, offsets)
-    return nx.to_numpy_array(G)
 
+    def __init__(self, N, offsets):
+        self.N = int(N)
+        offsets = {min(int(s) % self.N, -int(s) % self.N) for s in offsets}
+        if 0 in offsets:
+            raise ValueError("Offsets must be nonzero modulo N")
+        self.offsets = tuple(sorted(offsets))
+        # Distinct d with node i linked to i + d (mod N); s = N/2 occurs once
+        self.shifts = np.unique(np.concatenate(
+            [self.offsets, [self.N - s for s in self.offsets]]
+        )).astype(int)
+        self._eigenvalues = None
+        self._laplacian_eigenvalues = None
+
+    def __repr__(self):
+        return f"CirculantGraph(N={self.N}, offsets={self.offsets})"
+
+    @property
+    def shape(self):
+        return (self.N, self.N)
+
+    @property
+    def content_hash(self):
+        """Hex digest of (N, offsets), usable as a cache key."""
+        return hashlib.sha256(repr(self).encode()).hexdigest()
+
+    @property
+    def eigenvalues(self):
+        """Adjacency eigenvalues λ_k = Σ_d cos(2πkd/N), k = 0, ..., N-1.
+
+        The Fourier modes exp(2πi kj/N) are the eigenvectors.
+        """
+        if self._eigenvalues is None:
+            row = np.zeros(self.N)
+            row[self.shifts] = 1
+            self._eigenvalues = _read_only(np.fft.fft(row).real)
+        return self._eigenvalues
+
+    @property
+    def laplacian_eigenvalues(self):
+        """Laplacian eigenvalues in ascending order, in closed form.
+
+        Mode k has μ_k = Σ_s 2(1 - cos(2πks/N)) over the offsets s < N/2,
+        plus 1 - (-1)^k if N/2 is an offset (it contributes a single edge).
+        """
+        if self._laplacian_eigenvalues is None:
+            k = np.arange(self.N)[:, np.newaxis]
+            offsets = np.array(self.offsets)
+            weight = np.where(2 * offsets == self.N, 1.0, 2.0)
+            # 1 - cos x = 2 sin²(x/2), without the cancellation at small x
+            mu = np.sum(weight * 2 * np.sin(np.pi * k * offsets / self.N)**2,
+                        axis=1)
+            self._laplacian_eigenvalues = _read_only(np.sort(mu))
+        return self._laplacian_eigenvalues
+
+    @property
+    def is_connected(self):
+        """C_N(S) is connected iff gcd(N, S) = 1."""
+        return gcd(self.N, *self.offsets) == 1
+
+    def __matmul__(self, x):
+        """A @ x for x of shape (N,) or (N, k), real or complex."""
+        x = np.asarray(x)
+        if len(self.shifts) >= CIRCULANT_FFT_MIN_SHIFTS:
+            eigenvalues = self.eigenvalues.reshape((-1,) + (1,) * (x.ndim - 1))
+            if np.iscomplexobj(x):
+                return np.fft.ifft(np.fft.fft(x, axis=0) * eigenvalues, axis=0)
+            half = eigenvalues[:self.N // 2 + 1]
+            return np.fft.irfft(np.fft.rfft(x, axis=0) * half, n=self.N, axis=0)
+        result = np.zeros_like(x, dtype=np.result_type(x, float))
+        for d in self.shifts:
+            # (A x)_i gets x_{i+d}
+            result[:self.N - d] += x[d:]
+            result[self.N - d:] += x[:d]
+        return result
+
+    def toarray(self):
+        """Dense adjacency matrix, shape (N, N)."""
+        row = np.zeros(self.N)
+        row[self.shifts] = 1
+        index = np.arange(self.N)
+        return row[(index[np.newaxis, :] - index[:, np.newaxis]) % self.N]
+
+    def __array__(self, dtype=None, copy=None):
+        return self.toarray() if dtype is None else self.toarray().astype(dtype)
+
+    def tocoo(self):
+        """Adjacency matrix as a ``scipy.sparse.coo_array``."""
+        rows = np.repeat(np.arange(self.N), len(self.shifts))
+        cols = (rows.reshape(self.N, -1) + self.shifts).ravel() % self.N
+        return coo_array((np.ones(len(rows)), (rows, cols)), shape=self.shape)
+
+
+def _multiplier_images(N, offsets):
+    """Offset sets u*S (mod N, folded to [1, N/2]) for every unit u mod N.
 
-def path_graph(N):
+    Returns:
+        Array of shape (number of units, len(offsets)), each row sorted.
+    """
+    units = np.array([u for u in range(1, N // 2 + 1) if gcd(u, N) == 1])
+    images = units[:, np.newaxis] * np.asarray(offsets) % N
+    return np.sort(np.minimum(images, N - images), axis=1)
+
+
+def canonical_circulant_offsets(N, offsets):
+    """Canonical offset set of C_N(offsets) under multiplier isomorphisms.
+
+    For every u coprime to N, i -> u*i (mod N) maps C_N(S) onto C_N(uS), so
+    all the sets uS describe isomorphic graphs. The lexicographically
+    smallest one is taken as representative. For some N (e.g. 16) there are
+    isomorphic circulants that are not related by a multiplier; those stay
+    separate classes.
+
+    Returns:
+        canonical: The representative offset set, as a sorted tuple.
+        multiplicity: Number of distinct offset sets in the class.
+    """
+    offsets = CirculantGraph(N, offsets).offsets
+    images = np.unique(_multiplier_images(N, offsets), axis=0)
+    return tuple(int(s) for s in images[0]), len(images)
+
+
+def enumerate_circulant_graphs(N, max_graphs=None, connected=True):
+    """Enumerate circulant graphs on N nodes up to multiplier isomorphism.
+
+    Offset sets S ⊂ {1, ..., N//2} are visited by size, then
+    lexicographically, and a set is kept only if it is the canonical
+    representative of its class (see ``canonical_circulant_offsets``), so
+    no adjacency matrices are built or compared.
+
+    Args:
+        N: Number of nodes.
+        max_graphs: Stop after this many classes (None for all).
+        connected: Skip disconnected graphs, i.e. gcd(N, S) > 1.
+
+    Yields:
+        (CirculantGraph, multiplicity), multiplicity being the number of
+        offset sets isomorphic to it through a multiplier.
+    """
+    count = 0
+    for r in range(1, N // 2 + 1):
+        for subset in combinations(range(1, N // 2 + 1), r):
+            if connected and gcd(N, *subset) != 1:
+                continue
+            images = _multiplier_images(N, subset)
+            # Canonical iff no image is lexicographically smaller
+            differs = images != np.array(subset)
+            first = np.argmax(differs, axis=1)
+            rows = np.arange(len(images))
+            smaller = differs[rows, first] & (
+                images[rows, first] < np.array(subset)[first])
+            if np.any(smaller):
+                continue
+            yield (CirculantGraph(N, subset),
+                   len(np.unique(images, axis=0)))
+            count += 1
+            if max_graphs is not None and count >= max_graphs:
+                return
+
+
+def path_graph(N, sparse=False):
     """Path graph (chain): 1-2-3-...-N."""
-    G = nx.path_graph(N)
-    return nx.to_numpy_array(G)
+    nodes = np.arange(N - 1)
+    return _from_edges(N, nodes, nodes + 1, sparse)
 
 
-def cycle_graph(N):
+def cycle_graph(N, sparse=False):
     """Cycle graph (ring with k=1)."""
-    G = nx.cycle_graph(N)
-    return nx.to_numpy_array(G)
+    return circulant_graph(N, [1], sparse)
 
 
-def small_world_graph(N, k=4, p=0.3, seed=42):
-    """Watts-Strogatz small-world graph."""
-    G = nx.watts_strogatz_graph(N, k, p, seed=seed)
-    return nx.to_numpy_array(G)
+def small_world_graph(N, k=4, p=0.3, seed=42, sparse=False):
+    """Watts-Strogatz small-world graph.
 
+    Each node starts linked to its k//2 nearest neighbors on either side,
+    then every ring edge (u, u+j) is rewired to (u, w) with probability p,
+    w uniform among the nodes that are not u or already neighbors of u.
+    Draws come from ``random.Random(seed)`` in the same order as
+    ``networkx.watts_strogatz_graph``, so both give the same graph for the
+    same integer seed.
+    """
+    if k > N:
+        raise ValueError("k > N, choose smaller k or larger N")
+    if k == N:
+        return complete_graph(N, sparse)
+    half = k // 2
+    rng = random.Random(seed)
+    rand, choice = rng.random, rng.choice
+    nodes = range(N)
+    # Ring edge (u, u + j) is kept[(j - 1) * N + u]; rewired edges {a, b}
+    # are stored as min * N + max
+    kept = bytearray([1]) * (half * N)
+    rewired = set()
+    degree = [2 * half] * N
+
+    def has_edge(a, b):
+        d = (b - a) % N
+        if d <= half and kept[(d - 1) * N + a]:
+            return True
+        if N - d <= half and kept[(N - d - 1) * N + b]:
+            return True
+        return (a * N + b if a < b else b * N + a) in rewired
+
+    for j in range(1, half + 1):
+        for u in nodes:
+            if rand() < p:
+                w = choice(nodes)
+                while w == u or has_edge(u, w):
+                    w = choice(nodes)
+                    if degree[u] >= N - 1:
+                        break  # u is linked to everyone, keep the edge
+                else:
+                    kept[(j - 1) * N + u] = 0
+                    rewired.add(u * N + w if u < w else w * N + u)
+                    degree[(u + j) % N] -= 1
+                    degree[w] += 1
+
+    ring = np.flatnonzero(np.frombuffer(kept, dtype=np.uint8))
+    u = np.concatenate([ring % N,
+                        np.fromiter(rewired, np.int64, len(rewired)) // N])
+    v = np.concatenate([(ring % N + ring // N + 1) % N,
+                        np.fromiter(rewired, np.int64, len(rewired)) % N])
+    return _from_edges(N, u, v, sparse)
+
+
+def barbell_graph(m1, m2=0, sparse=False):
+    """Barbell graph: two complete graphs of size m1 connected by a path of length m2.
+
+    Nodes 0..m1-1 form the first clique, m1..m1+m2-1 the path and the
+    remaining m1 nodes the second clique.
+    """
+    if m1 < 2 or m2 < 0:
+        raise ValueError("Barbell graph needs m1 >= 2 and m2 >= 0")
+    u, v = np.triu_indices(m1, k=1)
+    chain = np.arange(m1 - 1, m1 + m2)  # last node of clique 1 to first of 2
+    N = 2 * m1 + m2
+    return _from_edges(N, np.concatenate([u, chain, u + m1 + m2]),
+                       np.concatenate([v, chain + 1, v + m1 + m2]), sparse)
 
-def barbell_graph(m1, m2=0):
-    """Barbell graph: two complete graphs of size m1 connected by a path of length m2."""
-    G = nx.barbell_graph(m1, m2)
-    return nx.to_numpy_array(G)
+
+def networkx_adjacency(name, *args, sparse=False, **kwargs):
+    """Adjacency matrix of the networkx counterpart of a generator here.
+
+    Meant for validating the native constructors, e.g.
+    ``networkx_adjacency('small_world_graph', 1000, k=4, seed=1)`` must equal
+    ``small_world_graph(1000, k=4, seed=1)``. Imports networkx on demand.
+
+    Args:
+        name: Generator name in this module ('complete_graph', 'ring_graph',
+            'star_graph', 'circulant_graph', 'path_graph', 'cycle_graph',
+            'small_world_graph' or 'barbell_graph').
+        *args, **kwargs: Arguments as for the generator.
+        sparse: Return a CSR array instead of a dense one.
+    """
+    import networkx as nx
+
+    builders = {
+        'complete_graph': nx.complete_graph,
+        'ring_graph': lambda N, k=1: nx.circulant_graph(N, range(1, k + 1)),
+        'star_graph': lambda N: nx.star_graph(N - 1),
+        'circulant_graph': nx.circulant_graph,
+        'path_graph': nx.path_graph,
+        'cycle_graph': nx.cycle_graph,
+        'small_world_graph': lambda N, k=4, p=0.3, seed=42:
+            nx.watts_strogatz_graph(N, k, p, seed=seed),
+        'barbell_graph': lambda m1, m2=0: nx.barbell_graph(m1, m2),
+    }
+    G = builders[name](*args, **kwargs)
+    nodelist = sorted(G)  # barbell_graph(m1, 1) adds the path node last
+    if sparse:
+        return nx.to_scipy_sparse_array(G, nodelist=nodelist, format='csr',
+                                        dtype=float)
+    return nx.to_numpy_array(G, nodelist=nodelist)
 
 
 def feedforward_graph(N):
@@ -81,30 +401,285 @@ def feedforward_graph(N):
     return A
 
 
-def laplacian_spectrum(adj_matrix):
+class Topology:
+    """Undirected network with memoized Laplacian spectral data.
+
+    Holds the adjacency matrix as a canonical CSR array together with the
+    degrees and a content hash, and computes the Laplacian eigenvalues,
+    eigenvectors and pseudo-inverse on first use only. The spectral
+    functions of this module, ``synchrony_alignment`` and the Kuramoto and
+    Stuart-Landau simulators accept it wherever they take an adjacency
+    matrix, so a graph used across several of them is decomposed once.
+
+    Args:
+        adj_matrix: Symmetric adjacency matrix, dense, scipy sparse or
+            ``CirculantGraph``, shape (N, N).
+    """
+
+    __slots__ = ('adjacency', 'degrees', 'content_hash',
+                 '_laplacian_eigenvalues', '_laplacian_eigh', '_laplacian_pinv',
+                 '_laplacian_extremes')
+
+    def __init__(self, adj_matrix):
+        if isinstance(adj_matrix, CirculantGraph):
+            adj_matrix = adj_matrix.tocoo()
+        adjacency = csr_array(adj_matrix, dtype=float)
+        adjacency.sum_duplicates()
+        adjacency.eliminate_zeros()
+        self.adjacency = adjacency
+        self.degrees = np.asarray(adjacency.sum(axis=1)).ravel()
+        h = hashlib.sha256(f"csr:{adjacency.shape}:".encode())
+        for part in (adjacency.indptr.astype(np.int64),
+                     adjacency.indices.astype(np.int64), adjacency.data):
+            h.update(part.tobytes())
+        self.content_hash = h.hexdigest()
+        self._laplacian_eigenvalues = None
+        self._laplacian_eigh = None
+        self._laplacian_pinv = None
+        self._laplacian_extremes = None
+
+    def __repr__(self):
+        return (f"Topology(N={self.N}, edges={self.adjacency.nnz // 2}, "
+                f"hash={self.content_hash[:12]})")
+
+    def __eq__(self, other):
+        return (isinstance(other, Topology)
+                and self.content_hash == other.content_hash)
+
+    def __hash__(self):
+        return hash(self.content_hash)
+
+    @property
+    def N(self):
+        return self.adjacency.shape[0]
+
+    @property
+    def shape(self):
+        return self.adjacency.shape
+
+    def toarray(self):
+        """Dense adjacency matrix, shape (N, N)."""
+        return self.adjacency.toarray()
+
+    def __array__(self, dtype=None, copy=None):
+        return self.toarray() if dtype is None else self.toarray().astype(dtype)
+
+    def laplacian(self):
+        """Dense graph Laplacian D - A."""
+        return np.diag(self.degrees) - self.toarray()
+
+    @property
+    def laplacian_eigenvalues(self):
+        """Laplacian eigenvalues in ascending order."""
+        if self._laplacian_eigenvalues is None:
+            if self._laplacian_eigh is not None:
+                self._laplacian_eigenvalues = self._laplacian_eigh[0]
+            else:
+                self._laplacian_eigenvalues = _read_only(
+                    np.linalg.eigvalsh(self.laplacian()))
+        return self._laplacian_eigenvalues
+
+    @property
+    def laplacian_eigh(self):
+        """Laplacian eigenvalues (ascending) and orthonormal eigenvectors."""
+        if self._laplacian_eigh is None:
+            self._laplacian_eigh = tuple(
+                _read_only(a) for a in np.linalg.eigh(self.laplacian()))
+            self._laplacian_eigenvalues = self._laplacian_eigh[0]
+        return self._laplacian_eigh
+
+    @property
+    def laplacian_pinv(self):
+        """Moore-Penrose pseudo-inverse L⁺, zero modes below ZERO_EIGENVALUE_TOL."""
+        if self._laplacian_pinv is None:
+            eigenvalues, vectors = self.laplacian_eigh
+            inverse = np.zeros_like(eigenvalues)
+            nonzero = eigenvalues > ZERO_EIGENVALUE_TOL
+            inverse[nonzero] = 1.0 / eigenvalues[nonzero]
+            self._laplacian_pinv = _read_only((vectors * inverse) @ vectors.T)
+        return self._laplacian_pinv
+
+    @property
+    def laplacian_extremes(self):
+        """Memoized ``sparse_laplacian_extremes`` of the graph."""
+        if self._laplacian_extremes is None:
+            self._laplacian_extremes = sparse_laplacian_extremes(self)
+        return self._laplacian_extremes
+
+
+def _read_only(array):
+    """Mark a memoized array read-only so callers cannot corrupt the cache."""
+    array.flags.writeable = False
+    return array
+
+
+def laplacian_spectrum(adj_matrix, return_vectors=False):
     """Compute the Laplacian eigenvalues of a graph.
 
-    Returns sorted eigenvalues (ascending).
+    Returns sorted eigenvalues (ascending). With return_vectors=True, also
+    the orthonormal eigenvectors as the columns of an (N, N) array.
+    Eigenvalues of a ``CirculantGraph`` come in closed form, those of a
+    ``Topology`` are memoized.
     """
+    if isinstance(adj_matrix, Topology):
+        if return_vectors:
+            return adj_matrix.laplacian_eigh
+        return adj_matrix.laplacian_eigenvalues
+    if isinstance(adj_matrix, CirculantGraph):
+        if not return_vectors:
+            return adj_matrix.laplacian_eigenvalues
+        adj_matrix = adj_matrix.toarray()
+    if issparse(adj_matrix):
+        adj_matrix = adj_matrix.toarray()
     D = np.diag(np.sum(adj_matrix, axis=1))
     L = D - adj_matrix
+    if return_vectors:
+        return np.linalg.eigh(L)
     eigenvalues = np.sort(np.real(np.linalg.eigvalsh(L)))
     return eigenvalues
 
 
-def algebraic_connectivity(adj_matrix):
-    """Compute algebraic connectivity (second smallest Laplacian eigenvalue)."""
+def sparse_laplacian_extremes(adj_matrix, tol=1e-4):
+    """Extreme Laplacian eigenvalues by Lanczos iteration on the CSR Laplacian.
+
+    Needs O(E) memory instead of the O(N²) of ``laplacian_spectrum``. The
+    zero modes, one per connected component, are projected out, so the
+    smallest eigenvalue found is the smallest nonzero one. On graphs with a
+    narrow reverse Cuthill-McKee bandwidth (rings, chains) it is of order
+    1/N² and sits in a tight cluster, so it is computed by shift-invert
+    about 0 from a sparse LU factorization, to near machine precision.
+    Wider graphs, e.g. small-world ones, would fill in the factors; their
+    gap is well separated and plain Lanczos finds it.
+
+    The largest eigenvalue always comes from plain Lanczos. At a band edge
+    (rings, chains) the top eigenvalues cluster as well and the Ritz value
+    stops short of the true maximum by about tol/10 relative; tighter tol
+    costs roughly 7x more iterations per decade.
+
+    Args:
+        adj_matrix: Symmetric adjacency matrix, dense, scipy sparse,
+            ``CirculantGraph`` or ``Topology``, shape (N, N).
+        tol: Relative residual tolerance of the Lanczos iterations.
+
+    Returns:
+        n_components: Number of connected components (zero eigenvalues).
+        smallest: Smallest nonzero eigenvalue, nan for an edgeless graph.
+        largest: Largest eigenvalue.
+    """
+    if isinstance(adj_matrix, Topology):
+        A = adj_matrix.adjacency
+    elif isinstance(adj_matrix, CirculantGraph):
+        A = csr_array(adj_matrix.tocoo())
+    else:
+        A = csr_array(adj_matrix, dtype=float)
+    N = A.shape[0]
+    degrees = np.asarray(A.sum(axis=1)).ravel()
+    L = csr_array(diags_array(degrees) - A)
+    n_components, labels = connected_components(A, directed=False)
+    if n_components == N:
+        return N, np.nan, 0.0
+    sizes = np.bincount(labels)
+
+    def project(x):
+        """Remove the component means, i.e. the zero modes."""
+        x = np.ravel(x)
+        return x - (np.bincount(labels, weights=x) / sizes)[labels]
+
+    v0 = project(np.random.default_rng(0).standard_normal(N))
+    largest = eigsh(L, k=1, which='LA', v0=v0, tol=tol,
+                    return_eigenvectors=False)[0]
+
+    order = reverse_cuthill_mckee(A, symmetric_mode=True)
+    position = np.argsort(order)
+    coo = A.tocoo()
+    bandwidth = np.max(np.abs(position[coo.row] - position[coo.col]))
+    if bandwidth <= SHIFT_INVERT_MAX_BANDWIDTH:
+        # λ maps to 1/(λ + τ), largest for the smallest nonzero λ; τ is
+        # below the 4/N² lower bound of the gap of a connected graph
+        tau = 1.0 / N**2
+        lu = splu(csc_array(L + tau * eye_array(N)))
+        operator = LinearOperator((N, N), dtype=float,
+                                  matvec=lambda x: project(lu.solve(project(x))))
+        mu = eigsh(operator, k=1, which='LA', v0=v0,
+                   return_eigenvectors=False)[0]
+        smallest = 1 / mu - tau
+    else:
+        # Zero modes are moved up to `largest`, out of the way of the gap
+        def matvec(x):
+            x = np.ravel(x)
+            return project(L @ project(x)) + largest * (x - project(x))
+
+        operator = LinearOperator((N, N), dtype=float, matvec=matvec)
+        smallest = eigsh(operator, k=1, which='SA', v0=v0, tol=tol,
+                         return_eigenvectors=False)[0]
+    return n_components, float(smallest), float(largest)
+
+
+def _use_sparse_spectrum(adj_matrix, method):
+    """Whether the extreme eigenvalues should come from Lanczos iteration.
+
+    'auto' picks it for graphs above DENSE_SPECTRUM_MAX_NODES nodes, except
+    circulant graphs (closed form) and topologies whose full spectrum is
+    already known.
+    """
+    if method not in ('auto', 'dense', 'sparse'):
+        raise ValueError(f"Unknown method: {method}")
+    if method != 'auto':
+        return method == 'sparse'
+    if isinstance(adj_matrix, CirculantGraph):
+        return False
+    if (isinstance(adj_matrix, Topology)
+            and adj_matrix._laplacian_eigenvalues is not None):
+        return False
+    return adj_matrix.shape[0] > DENSE_SPECTRUM_MAX_NODES
+
+
+def _laplacian_extremes(adj_matrix):
+    """``sparse_laplacian_extremes``, memoized for a ``Topology``."""
+    if isinstance(adj_matrix, Topology):
+        return adj_matrix.laplacian_extremes
+    return sparse_laplacian_extremes(adj_matrix)
+
+
+def _nonzero_eigenvalues(adj_matrix, eigs):
+    """Nonzero part of a sorted Laplacian spectrum.
+
+    A circulant graph has exactly gcd(N, S) zero modes; counting them
+    matters for large rings, whose gap drops below ZERO_EIGENVALUE_TOL.
+    """
+    if isinstance(adj_matrix, CirculantGraph):
+        return eigs[gcd(adj_matrix.N, *adj_matrix.offsets):]
+    return eigs[eigs > ZERO_EIGENVALUE_TOL]
+
+
+def algebraic_connectivity(adj_matrix, method='auto'):
+    """Compute algebraic connectivity (second smallest Laplacian eigenvalue).
+
+    Args:
+        adj_matrix: Adjacency matrix or graph object, shape (N, N).
+        method: 'dense' (full spectrum), 'sparse' (Lanczos, see
+            ``sparse_laplacian_extremes``) or 'auto' to choose by size.
+    """
+    if _use_sparse_spectrum(adj_matrix, method):
+        n_components, smallest, _ = _laplacian_extremes(adj_matrix)
+        return smallest if n_components == 1 else 0.0
     eigs = laplacian_spectrum(adj_matrix)
     return eigs[1]
 
 
-def spectral_gap_ratio(adj_matrix):
+def spectral_gap_ratio(adj_matrix, method='auto'):
     """Compute ratio of largest to smallest nonzero Laplacian eigenvalue.
 
     A smaller ratio means better synchronizability (tighter eigenvalue spread).
+    method is as for ``algebraic_connectivity``.
     """
+    if _use_sparse_spectrum(adj_matrix, method):
+        n_components, smallest, largest = _laplacian_extremes(adj_matrix)
+        if adj_matrix.shape[0] - n_components < 2:
+            return np.inf
+        return largest / smallest
     eigs = laplacian_spectrum(adj_matrix)
-    nonzero = eigs[eigs > 1e-10]
+    nonzero = _nonzero_eigenvalues(adj_matrix, eigs)
     if len(nonzero) < 2:
         return np.inf
     return nonzero[-1] / nonzero[0]
@@ -130,17 +705,45 @@ def get_topology_suite(N=10):
     return topologies
 
 
-def get_topology_properties(adj_matrix, name=""):
-    """Compute key properties of a network topology."""
-    eigs = laplacian_spectrum(adj_matrix)
-    nonzero = eigs[eigs > 1e-10]
+def node_degrees(adj_matrix):
+    """Weighted degree of every node.
+
+    Args:
+        adj_matrix: Adjacency matrix, dense, scipy sparse,
+            ``CirculantGraph`` or ``Topology``, shape (N, N).
+
+    Returns:
+        Row sums of the adjacency matrix, shape (N,).
+    """
+    if isinstance(adj_matrix, Topology):
+        return adj_matrix.degrees
+    if isinstance(adj_matrix, CirculantGraph):
+        return np.full(adj_matrix.N, float(len(adj_matrix.shifts)))
+    return np.asarray(adj_matrix.sum(axis=1), dtype=float).ravel()
+
+
+def get_topology_properties(adj_matrix, name="", method='auto'):
+    """Compute key properties of a network topology.
+
+    With the sparse method (see ``algebraic_connectivity``) only the extreme
+    eigenvalues are computed and 'laplacian_eigenvalues' is None.
+    """
     N = adj_matrix.shape[0]
+    degrees = node_degrees(adj_matrix)
+    if _use_sparse_spectrum(adj_matrix, method):
+        eigs = None
+        n_components, smallest, largest = _laplacian_extremes(adj_matrix)
+        n_nonzero = N - n_components
+        nonzero = np.array([smallest, largest][:n_nonzero])
+    else:
+        eigs = laplacian_spectrum(adj_matrix)
+        nonzero = _nonzero_eigenvalues(adj_matrix, eigs)
     return {
         'name': name,
         'N': N,
-        'num_edges': int(np.sum(adj_matrix) / 2),
+        'num_edges': int(np.sum(degrees) / 2),
         'algebraic_connectivity': nonzero[0] if len(nonzero) > 0 else 0,
         'spectral_gap_ratio': nonzero[-1] / nonzero[0] if len(nonzero) >= 2 else np.inf,
         'laplacian_eigenvalues': eigs,
-        'mean_degree': np.mean(np.sum(adj_matrix, axis=1)),
+        'mean_degree': np.mean(degrees),
     }
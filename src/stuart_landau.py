@@ -1,49 +1,315 @@
 """
-Stuart-Landau oscillator model for feedforward networks.
+Stuart-Landau oscillator model for feedforward and general networks.
 
 Implements the coupled Stuart-Landau system:
     dz_i/dt = (μ_i + iω_i)z_i - |z_i|^2 z_i + λ * z_{i-1}  (feedforward coupling)
 
+and its generalization to an arbitrary (weighted, directed) adjacency:
+    dz_i/dt = (μ_i + iω_i)z_i - |z_i|^2 z_i + λ Σ_j A_ij z_j
+
+with complex coupling λ. The feedforward chain is the special case
+A_ij = 1 for j = i - 1, i.e. ``networks.feedforward_graph`` without the
+self-loop on node 1.
+
 Based on Ahmed, Cameron, Palacios et al. (2026).
 """
 
 import numpy as np
-from scipy.integrate import solve_ivp
+from scipy import sparse
+
+from integrators import (
+    integrate_streaming, TrajectoryRecorder, StationarityTracker
+)
+from kuramoto import coupling_matrix, kuramoto_jac_sparsity, LOCKED_TOL
+from networks import CirculantGraph
 
 
 def stuart_landau_feedforward_rhs(t, z_flat, mu, omega, lam):
     """RHS for feedforward Stuart-Landau network.
 
+    The interleaved real state is viewed in place as complex, so no copies
+    are made and the same function handles a batch of B independent chains.
+
     Args:
         t: Time.
-        z_flat: Flattened complex state [Re(z_1), Im(z_1), Re(z_2), Im(z_2), ...].
-        mu: Excitation parameters, shape (N,).
-        omega: Natural frequencies, shape (N,).
-        lam: Coupling strength (scalar, real and positive).
+        z_flat: Flattened complex state [Re(z_1), Im(z_1), Re(z_2), Im(z_2), ...],
+            shape (2N,), or B such states back to back, shape (2BN,).
+        mu: Excitation parameters, shape (N,) or (B, N).
+        omega: Natural frequencies, shape (N,) or (B, N).
+        lam: Coupling strength (real and positive), scalar or shape (B, 1).
 
     Returns:
         dz/dt as flattened real array.
     """
-    N = len(mu)
-    z = z_flat[0::2] + 1j * z_flat[1::2]
+    z = np.ascontiguousarray(z_flat).view(complex).reshape(np.shape(mu))
+
+    dz = (mu + 1j * omega) * z - (z.real**2 + z.imag**2) * z
+    # Feedforward drive z_{i-1} -> z_i; the first oscillator has no input
+    dz[..., 1:] += lam * z[..., :-1]
+    return dz.view(float).ravel()
+
+
+def stuart_landau_network_rhs(t, z_flat, mu, omega, lam, adj_matrix):
+    """RHS for a Stuart-Landau network on an arbitrary adjacency matrix.
+
+    Args:
+        t: Time.
+        z_flat: Interleaved real state as in ``stuart_landau_feedforward_rhs``,
+            shape (2N,) or (2BN,) for B independent networks.
+        mu: Excitation parameters, shape (N,) or (B, N).
+        omega: Natural frequencies, shape (N,) or (B, N).
+        lam: Coupling strength, real or complex, scalar or shape (B, 1).
+        adj_matrix: Adjacency matrix, shape (N, N), dense, scipy sparse
+            (CSR is fastest) or ``networks.CirculantGraph``. A_ij weights the
+            input from node j to node i.
+
+    Returns:
+        dz/dt as flattened real array.
+    """
+    z = np.ascontiguousarray(z_flat).view(complex).reshape(np.shape(mu))
+
+    dz = (mu + 1j * omega) * z - (z.real**2 + z.imag**2) * z
+    # Σ_j A_ij z_j for every member; z.T is (N, B) for a batch
+    dz += lam * (adj_matrix @ z.T).T
+    return dz.view(float).ravel()
+
+
+def stuart_landau_feedforward_jacobian(t, z_flat, mu, omega, lam):
+    """Jacobian of ``stuart_landau_feedforward_rhs`` for the implicit solvers.
+
+    Returns:
+        Sparse CSC matrix with respect to the interleaved real state,
+        shape (2N, 2N) or (2BN, 2BN) for a batch.
+    """
+    z = np.ascontiguousarray(z_flat).view(complex).reshape(np.shape(mu))
+    N = np.shape(mu)[-1]
+    return _complex_jacobian(z, mu, omega, lam, np.arange(1, N),
+                             np.arange(N - 1), np.ones(N - 1))
+
+
+def stuart_landau_network_jacobian(t, z_flat, mu, omega, lam, adj_matrix):
+    """Jacobian of ``stuart_landau_network_rhs`` for the implicit solvers.
+
+    Returns:
+        Sparse CSC matrix with respect to the interleaved real state,
+        shape (2N, 2N) or (2BN, 2BN) for a batch.
+    """
+    z = np.ascontiguousarray(z_flat).view(complex).reshape(np.shape(mu))
+    if isinstance(adj_matrix, CirculantGraph):
+        adj = adj_matrix.tocoo()
+    else:
+        adj = sparse.coo_array(adj_matrix)
+    return _complex_jacobian(z, mu, omega, lam, adj.row, adj.col, adj.data)
+
+
+def stuart_landau_jac_sparsity(adj_matrix, n_batch=1):
+    """Sparsity pattern of the Stuart-Landau Jacobian.
+
+    Each nonzero of the Kuramoto pattern (edges plus diagonal) becomes a
+    dense 2x2 block coupling (Re z, Im z). Pass
+    ``networks.feedforward_graph(N)`` for the feedforward chain.
+
+    Returns:
+        Boolean sparse CSR matrix, shape (2 n_batch N, 2 n_batch N).
+    """
+    return sparse.kron(kuramoto_jac_sparsity(adj_matrix, n_batch),
+                       np.ones((2, 2), dtype=bool), format='csr')
+
 
-    dz = np.zeros(N, dtype=complex)
-    for i in range(N):
-        dz[i] = (mu[i] + 1j * omega[i]) * z[i] - np.abs(z[i])**2 * z[i]
-        if i > 0:
-            dz[i] += lam * z[i-1]
-        elif i == 0:
-            # Self-feedback for first oscillator (optional external drive)
-            pass
+def _complex_jacobian(z, mu, omega, lam, rows, cols, weights):
+    """Real Jacobian of dz_i/dt = (μ_i + iω_i)z_i - |z_i|^2 z_i + λ Σ_j A_ij z_j.
+
+    A complex function f = P dz + Q dz̄ acts on (Re z, Im z) as the 2x2 block
+    [[Re(P+Q), -Im(P-Q)], [Im(P+Q), Re(P-Q)]]. Locally P = μ + iω - 2|z|^2
+    and Q = -z^2; each edge j -> i contributes P = λ A_ij, Q = 0.
+
+    Args:
+        z: Complex states, shape (N,) or (B, N).
+        mu, omega: Shape (N,) or (B, N).
+        lam: Coupling strength, scalar or shape (B, 1).
+        rows, cols, weights: Edges of A in COO form.
 
-    dz_flat = np.zeros(2 * N)
-    dz_flat[0::2] = np.real(dz)
-    dz_flat[1::2] = np.imag(dz)
-    return dz_flat
+    Returns:
+        Sparse CSC matrix, shape (2BN, 2BN).
+    """
+    z = np.atleast_2d(z)
+    B, N = z.shape
+    p = mu + 1j * omega - 2 * (z.real**2 + z.imag**2)
+    q = -z**2
+
+    offsets = N * np.arange(B)[:, np.newaxis]
+    edge = np.broadcast_to(np.reshape(lam, (-1, 1)) * weights,
+                           (B, len(weights))).ravel()
+    nodes = np.arange(B * N)
+    block_rows = np.concatenate([nodes, (rows + offsets).ravel()])
+    block_cols = np.concatenate([nodes, (cols + offsets).ravel()])
+    plus = np.concatenate([(p + q).ravel(), edge])
+    minus = np.concatenate([(p - q).ravel(), edge])
+
+    r, c = 2 * block_rows, 2 * block_cols
+    return sparse.csc_array(
+        (np.concatenate([plus.real, -minus.imag, plus.imag, minus.real]),
+         (np.concatenate([r, r, r + 1, r + 1]),
+          np.concatenate([c, c + 1, c, c + 1]))),
+        shape=(2 * B * N, 2 * B * N)
+    )
+
+
+def feedforward_locked_state(mu, omega, lam, tol=1e-9):
+    """Phase-locked orbits of feedforward chains, solved node by node.
+
+    Node 1 has no input, so for μ_1 > 0 it settles on its limit cycle
+    z_1 = √μ_1 exp(iω_1 t) and sets the common frequency Ω = ω_1. In the
+    frame rotating at Ω a locked node k is a fixed point w_k of
+
+        (μ_k - iν_k - |w_k|^2) w_k + λ w_{k-1} = 0,    ν_k = Ω - ω_k,
+
+    so u = |w_k|^2 is a positive root of the cubic
+    u((u - μ_k)^2 + ν_k^2) = |λ|^2 |w_{k-1}|^2 and
+    w_k = λ w_{k-1} / (u - μ_k + iν_k). The Jacobian is block triangular,
+    so the orbit is stable iff every node's response is, i.e. iff
+    2u > μ_k and (2u - μ_k)^2 + ν_k^2 > u^2 at every node. Node k's
+    perturbations decay at rates -(μ_k - 2u) ∓ Re √(u^2 - ν_k^2), node 1's
+    amplitude at 2μ_1.
+
+    Args:
+        mu: Excitation parameters, shape (N,) or (B, N).
+        omega: Natural frequencies, shape (N,) or (B, N).
+        lam: Coupling strength, scalar or shape (B,).
+        tol: Margin by which the stability conditions must hold.
+
+    Returns:
+        w: Locked complex amplitudes in the rotating frame, with w_1 = √μ_1
+            real, shape (B, N).
+        Omega: Common frequency, shape (B,).
+        unique: Boolean, shape (B,). True where the chain has exactly one
+            stable locked orbit. Elsewhere (μ_1 <= 0, or a node with no
+            or several stable responses) the outcome depends on the initial
+            state and w is NaN from the first such node on.
+        decay: Slowest decay rate of perturbations of the orbit, apart from
+            the neutral phase shift, shape (B,). Only meaningful where
+            unique.
+    """
+    mu = np.atleast_2d(np.asarray(mu, dtype=float))
+    omega = np.atleast_2d(np.asarray(omega, dtype=float))
+    B = max(mu.shape[0], omega.shape[0], np.size(lam))
+    N = mu.shape[1]
+    mu = np.broadcast_to(mu, (B, N))
+    omega = np.broadcast_to(omega, (B, N))
+    lam = np.broadcast_to(np.ravel(lam), (B,))
+
+    w = np.full((B, N), np.nan, dtype=complex)
+    unique = mu[:, 0] > 0
+    w[unique, 0] = np.sqrt(mu[unique, 0])
+    Omega = omega[:, 0].copy()
+    decay = 2 * mu[:, 0]
+
+    for k in range(1, N):
+        m, nu = mu[:, k], Omega - omega[:, k]
+        drive = np.abs(lam)**2 * np.abs(w[:, k - 1])**2
+        # Companion matrices of u^3 - 2μu^2 + (μ^2 + ν^2)u - drive
+        companion = np.zeros((B, 3, 3))
+        companion[:, 0] = np.column_stack([2 * m, -(m**2 + nu**2),
+                                           np.nan_to_num(drive)])
+        companion[:, 1, 0] = companion[:, 2, 1] = 1
+        roots = np.linalg.eigvals(companion)
+
+        u = roots.real
+        m, nu = m[:, np.newaxis], nu[:, np.newaxis]
+        stable = ((np.abs(roots.imag) <= 1e-7 * np.maximum(1, np.abs(roots)))
+                  & (u >= 0) & (2 * u - m > tol)
+                  & ((2 * u - m)**2 + nu**2 - u**2 > tol))
+        unique &= np.sum(stable, axis=1) == 1
+
+        u_k = np.where(stable, u, 0).sum(axis=1)
+        m, nu = m[:, 0], nu[:, 0]
+        w[unique, k] = (lam * w[:, k - 1] / (u_k - m + 1j * nu))[unique]
+        rate = 2 * u_k - m - np.sqrt(u_k**2 - nu**2 + 0j).real
+        decay = np.minimum(decay, rate)
+
+    return w, Omega, unique, decay
+
+
+class SteadyRotationMonitor:
+    """Observer that stops the integration once every oscillator rotates uniformly.
+
+    Forwards each block to a ``TrajectoryRecorder`` and tracks the amplitude
+    |z_i| and instantaneous frequency of every node. Once all of them have
+    stayed within ``tol`` (peak to peak) for ``window`` time units, the
+    state is a rigid rotation z_i(t) = z_i(t_s) exp(iΩ_i (t - t_s)). The
+    remaining output samples are generated from that formula, with Ω_i the
+    mean frequency over the stretch, and the integrator is asked to stop.
+
+    Args:
+        recorder: ``TrajectoryRecorder`` receiving the samples.
+        t_out: Output grid of the integration.
+        tol: Tolerance on the amplitude and frequency ranges.
+        window: Length of the stationarity window in time units.
+    """
+
+    def __init__(self, recorder, t_out, tol, window=10.0):
+        self.recorder = recorder
+        self.t_out = t_out
+        self.window = window
+        self.dt = t_out[1] - t_out[0]
+        self._stationary = StationarityTracker(tol)
+        self._z_last = None
+        # Time of the last integrated sample if the run stopped early
+        self.t_stop = None
+
+    def __call__(self, t, y):
+        self.recorder(t, y)
+        z = np.ascontiguousarray(y.T).view(complex)  # (k, B*N)
+        z_prev, self._z_last = self._z_last, z[-1]
+        if z_prev is None:
+            return False
+
+        # Phase advance per step, assuming |Ω| dt < π
+        z_shift = np.vstack([z_prev, z[:-1]])
+        freq = np.angle(z * z_shift.conj()) / self.dt
+        signals = np.concatenate([np.abs(z), freq], axis=1).T
+        if self._stationary.update(t, signals) < self.window:
+            return False
+
+        # Rigid rotation: emit the samples the recorder would still keep
+        remaining = self.t_out[(self.t_out > t[-1])
+                               & (self.t_out >= self.recorder.t_start)]
+        if self.recorder.max_samples is not None:
+            remaining = remaining[-self.recorder.max_samples:]
+        if len(remaining):
+            omega = self._stationary.mean[z.shape[1]:]
+            z_rest = z[-1] * np.exp(1j * np.outer(remaining - t[-1], omega))
+            self.recorder(remaining, z_rest.view(float).T)
+        self.t_stop = t[-1]
+        return True
+
+
+def _phase_locked(z_out, dt):
+    """Phase-locking test on the tail of a trajectory.
+
+    Phase locked if the instantaneous frequency of every oscillator has
+    variance < 0.01 over the last 100 samples.
+
+    Args:
+        z_out: Complex states after the transient, shape (T_out, ..., N).
+        dt: Output step.
+
+    Returns:
+        Boolean, or array of booleans for the leading batch axes.
+    """
+    if len(z_out) <= 100:
+        return np.zeros(z_out.shape[1:-1], dtype=bool)
+    phases = np.angle(z_out[-101:])
+    # Compute instantaneous frequencies (finite differences)
+    dphase = np.diff(np.unwrap(phases, axis=0), axis=0) / dt
+    freq_var = np.var(dphase, axis=0)
+    return np.all(freq_var < 0.01, axis=-1)
 
 
 def simulate_stuart_landau_ff(mu, omega, lam, T=200.0, dt=0.01,
-                               z0=None, seed=None, t_transient=100.0):
+                               z0=None, seed=None, t_transient=100.0,
+                               method='RK45', steady_tol=None,
+                               steady_window=10.0):
     """Simulate feedforward Stuart-Landau network.
 
     Args:
@@ -55,6 +321,15 @@ def simulate_stuart_landau_ff(mu, omega, lam, T=200.0, dt=0.01,
         z0: Initial complex states. If None, small random perturbations.
         seed: Random seed.
         t_transient: Transient to discard.
+        method: Integrator. 'RK45' (default) or another ``solve_ivp`` name
+            for adaptive steps (the implicit 'BDF', 'Radau' and 'LSODA' get
+            the analytic Jacobian), or 'euler', 'heun', 'rk4' for fixed
+            steps of size dt.
+        steady_tol: Stop once every oscillator rotates uniformly within this
+            tolerance for steady_window time units and extrapolate the rest
+            of the trajectory; see ``SteadyRotationMonitor``. None (default)
+            always integrates up to T.
+        steady_window: Length of the stationarity window in time units.
 
     Returns:
         t_out: Time array (after transient).
@@ -71,44 +346,248 @@ def simulate_stuart_landau_ff(mu, omega, lam, T=200.0, dt=0.01,
     z0_flat[0::2] = np.real(z0)
     z0_flat[1::2] = np.imag(z0)
 
-    t_span = (0, T)
-    t_eval = np.arange(0, T, dt)
+    # Only the trajectory after the transient is kept
+    recorder = TrajectoryRecorder(t_start=t_transient)
+    observer = recorder
+    if steady_tol is not None:
+        observer = SteadyRotationMonitor(recorder, np.arange(0, T, dt),
+                                         steady_tol, steady_window)
+    integrate_streaming(stuart_landau_feedforward_rhs, (0, T), z0_flat, dt,
+                        observer, method=method, args=(mu, omega, lam),
+                        jac=stuart_landau_feedforward_jacobian)
+
+    # Reconstruct complex states
+    y = recorder.y
+    z_out = (y[0::2] + 1j * y[1::2]).T  # shape (T_out, N)
+
+    return recorder.t, z_out, bool(_phase_locked(z_out, dt))
+
+
+def simulate_stuart_landau_ff_batch(mu, omega, lam, T=200.0, dt=0.01,
+                                    z0=None, seeds=None, t_transient=100.0,
+                                    n_keep=None, method='RK45',
+                                    steady_tol=None, steady_window=10.0,
+                                    locked_solver=False):
+    """Simulate B independent feedforward chains in one vectorized integration.
+
+    Passing ``seeds`` reproduces the initial states ``simulate_stuart_landau_ff``
+    draws for the same seeds. The adaptive step size is controlled on the
+    stacked state, so every member advances with the step of the stiffest.
+
+    Args:
+        mu: Excitation parameters, shape (N,) shared or (B, N).
+        omega: Natural frequencies, shape (N,) shared or (B, N).
+        lam: Coupling strength, scalar or shape (B,).
+        T: Total time.
+        dt: Output step.
+        z0: Initial complex states, shape (B, N). If None, drawn from seeds.
+        seeds: Sequence of B random seeds, one per member.
+        t_transient: Transient to discard.
+        n_keep: Keep only the last n_keep output samples (at least 101 for
+            the phase-locking test). None keeps everything after the
+            transient.
+        method: Integrator; see ``simulate_stuart_landau_ff``.
+        steady_tol, steady_window: Early stopping once every member rotates
+            uniformly; see ``simulate_stuart_landau_ff``.
+        locked_solver: Members whose chain has a unique stable locked orbit
+            (``feedforward_locked_state``) that attracts fast enough to be
+            reached within ``LOCKED_TOL`` by t_transient are not
+            integrated; their output is that orbit, in phase with node 1
+            (which rotates at exactly ω_1 from its initial phase). Only the
+            other members are simulated. The acceptance test ignores the
+            escape time from the unstable origin for small initial states
+            and any coexisting drifting attractor, so it is an
+            approximation and off by default.
+
+    Returns:
+        t_out: Time array (after transient).
+        z_out: Complex states, shape (T_out, B, N).
+        is_phase_locked: Boolean array, shape (B,).
+    """
+    mu, omega, lam, z0 = _batch_inputs(mu, omega, lam, z0, seeds, float)
+    if locked_solver:
+        return _solved_or_simulated(mu, omega, lam, z0, T, dt, t_transient,
+                                    n_keep, method, steady_tol, steady_window)
+    t_out, z_out = _integrate_batch(
+        stuart_landau_feedforward_rhs, stuart_landau_feedforward_jacobian, z0,
+        (mu, omega, lam), T, dt, t_transient, n_keep, method,
+        steady_tol, steady_window
+    )
+    return t_out, z_out, _phase_locked(z_out, dt)
+
+
+def _solved_or_simulated(mu, omega, lam, z0, T, dt, t_transient, n_keep,
+                         method, steady_tol, steady_window):
+    """``simulate_stuart_landau_ff_batch(locked_solver=True)`` on batch inputs."""
+    w, Omega, unique, decay = feedforward_locked_state(mu, omega, lam[:, 0])
+    # Use the orbit only where an O(1) initial deviation would have decayed
+    # below LOCKED_TOL by the end of the transient
+    solved = unique & (np.exp(-decay * t_transient) < LOCKED_TOL)
+
+    t_out = np.arange(0, T, dt)
+    t_out = t_out[t_out >= t_transient]
+    if n_keep is not None:
+        t_out = t_out[-n_keep:]
+    z_out = np.empty((len(t_out),) + z0.shape, dtype=complex)
+    locked = solved.copy()
+
+    phase = np.angle(z0[solved, 0]) + np.outer(t_out, Omega[solved])
+    z_out[:, solved] = w[solved] * np.exp(1j * phase)[:, :, np.newaxis]
+    if not np.all(solved):
+        rest = ~solved
+        _, z_out[:, rest], locked[rest] = simulate_stuart_landau_ff_batch(
+            mu[rest], omega[rest], lam[rest, 0], T=T, dt=dt, z0=z0[rest],
+            t_transient=t_transient, n_keep=n_keep, method=method,
+            steady_tol=steady_tol, steady_window=steady_window
+        )
+    return t_out, z_out, locked
+
+
+def simulate_stuart_landau_network(mu, omega, lam, adj_matrix, T=200.0,
+                                   dt=0.01, z0=None, seed=None,
+                                   t_transient=100.0, method='RK45',
+                                   steady_tol=None, steady_window=10.0):
+    """Simulate a Stuart-Landau network on an arbitrary topology.
+
+    Draws the same initial states as ``simulate_stuart_landau_ff`` for a
+    given seed, so a feedforward adjacency reproduces its results.
+
+    Args:
+        mu: Excitation parameters, shape (N,).
+        omega: Natural frequencies, shape (N,).
+        lam: Coupling strength, real or complex.
+        adj_matrix: Adjacency matrix, shape (N, N), dense, scipy sparse,
+            ``networks.CirculantGraph`` or ``networks.Topology``.
+        T: Total time.
+        dt: Output step.
+        z0: Initial complex states. If None, small random perturbations.
+        seed: Random seed.
+        t_transient: Transient to discard.
+        method: Integrator; see ``simulate_stuart_landau_ff``.
+        steady_tol, steady_window: Early stopping; see
+            ``simulate_stuart_landau_ff``.
+
+    Returns:
+        t_out: Time array (after transient).
+        z_out: Complex states, shape (T_out, N).
+        is_phase_locked: Boolean, whether system reached phase-locked state.
+    """
+    if z0 is None:
+        rng = np.random.default_rng(seed)
+        N = len(mu)
+        z0 = 0.1 * (rng.standard_normal(N) + 1j * rng.standard_normal(N))
 
-    sol = solve_ivp(
-        stuart_landau_feedforward_rhs, t_span, z0_flat,
-        args=(mu, omega, lam),
-        t_eval=t_eval, method='RK45',
-        rtol=1e-8, atol=1e-10
+    t_out, z_out, locked = simulate_stuart_landau_network_batch(
+        mu, omega, lam, adj_matrix, T=T, dt=dt, z0=[z0],
+        t_transient=t_transient, method=method, steady_tol=steady_tol,
+        steady_window=steady_window
     )
+    return t_out, z_out[:, 0], bool(locked[0])
 
-    if not sol.success:
-        raise RuntimeError(f"Integration failed: {sol.message}")
 
-    # Reconstruct complex states
-    z = sol.y[0::2] + 1j * sol.y[1::2]  # shape (N, T)
-    z = z.T  # shape (T, N)
-
-    # Discard transient
-    mask = sol.t >= t_transient
-    t_out = sol.t[mask]
-    z_out = z[mask]
-
-    # Check phase locking: frequency differences should vanish
-    if len(z_out) > 100:
-        phases = np.angle(z_out)
-        # Compute instantaneous frequencies (finite differences)
-        dphase = np.diff(np.unwrap(phases, axis=0), axis=0) / dt
-        # Phase locked if frequency variance across oscillators is small
-        freq_var = np.var(dphase[-100:], axis=0)
-        is_phase_locked = np.all(freq_var < 0.01)
-    else:
-        is_phase_locked = False
+def simulate_stuart_landau_network_batch(mu, omega, lam, adj_matrix, T=200.0,
+                                         dt=0.01, z0=None, seeds=None,
+                                         t_transient=100.0, n_keep=None,
+                                         method='RK45', steady_tol=None,
+                                         steady_window=10.0):
+    """Simulate B Stuart-Landau networks sharing one topology.
 
-    return t_out, z_out, is_phase_locked
+    Members may differ in μ, ω, λ and initial state. Large sparse graphs
+    are coupled through a CSR matrix-vector product.
+
+    Args:
+        mu: Excitation parameters, shape (N,) shared or (B, N).
+        omega: Natural frequencies, shape (N,) shared or (B, N).
+        lam: Coupling strength, real or complex, scalar or shape (B,).
+        adj_matrix: Adjacency matrix, shape (N, N), dense, scipy sparse,
+            ``networks.CirculantGraph`` or ``networks.Topology``.
+        T: Total time.
+        dt: Output step.
+        z0: Initial complex states, shape (B, N). If None, drawn from seeds.
+        seeds: Sequence of B random seeds, one per member.
+        t_transient: Transient to discard.
+        n_keep: Keep only the last n_keep output samples; see
+            ``simulate_stuart_landau_ff_batch``.
+        method: Integrator; see ``simulate_stuart_landau_ff``.
+        steady_tol, steady_window: Early stopping once every member rotates
+            uniformly; see ``simulate_stuart_landau_ff``.
+
+    Returns:
+        t_out: Time array (after transient).
+        z_out: Complex states, shape (T_out, B, N).
+        is_phase_locked: Boolean array, shape (B,).
+    """
+    adj = coupling_matrix(adj_matrix)
+    if sparse.issparse(adj):
+        adj = sparse.csr_array(adj)
+
+    mu, omega, lam, z0 = _batch_inputs(mu, omega, lam, z0, seeds, complex)
+    t_out, z_out = _integrate_batch(
+        stuart_landau_network_rhs, stuart_landau_network_jacobian, z0,
+        (mu, omega, lam, adj), T, dt, t_transient, n_keep, method,
+        steady_tol, steady_window
+    )
+    return t_out, z_out, _phase_locked(z_out, dt)
+
+
+def _batch_inputs(mu, omega, lam, z0, seeds, lam_dtype):
+    """Broadcast per-member parameters and initial states to a batch.
+
+    Initial states drawn from seeds match those of the single-run
+    simulators.
+
+    Returns:
+        mu, omega: Shape (B, N).
+        lam: Shape (B, 1).
+        z0: Complex initial states, shape (B, N), C-contiguous.
+    """
+    mu = np.atleast_2d(np.asarray(mu, dtype=float))
+    omega = np.atleast_2d(np.asarray(omega, dtype=float))
+    lam = np.atleast_1d(np.asarray(lam, dtype=lam_dtype))
+    N = mu.shape[1]
+
+    if z0 is None:
+        if seeds is None:
+            raise ValueError("Either z0 or seeds must be given")
+        z0 = []
+        for s in seeds:
+            rng = np.random.default_rng(s)
+            z0.append(0.1 * (rng.standard_normal(N) + 1j * rng.standard_normal(N)))
+    z0 = np.atleast_2d(np.asarray(z0, dtype=complex))
+
+    B = max(mu.shape[0], omega.shape[0], lam.shape[0], z0.shape[0])
+    mu = np.broadcast_to(mu, (B, N))
+    omega = np.broadcast_to(omega, (B, N))
+    lam = np.broadcast_to(lam, (B,))[:, np.newaxis]
+    z0 = np.ascontiguousarray(np.broadcast_to(z0, (B, N)))
+    return mu, omega, lam, z0
+
+
+def _integrate_batch(rhs, jac, z0, args, T, dt, t_transient, n_keep, method,
+                     steady_tol=None, steady_window=10.0):
+    """Integrate a batch of complex states, keeping the post-transient tail.
+
+    Returns:
+        t_out: Time array (after transient).
+        z_out: Complex states, shape (T_out, B, N).
+    """
+    B, N = z0.shape
+    recorder = TrajectoryRecorder(t_start=t_transient, max_samples=n_keep)
+    observer = recorder
+    if steady_tol is not None:
+        observer = SteadyRotationMonitor(recorder, np.arange(0, T, dt),
+                                         steady_tol, steady_window)
+    integrate_streaming(rhs, (0, T), z0.view(float).ravel(), dt, observer,
+                        method=method, args=args, jac=jac)
+
+    # recorder.y is (2BN, T_out) interleaved -> complex (T_out, B, N)
+    y = np.ascontiguousarray(recorder.y.T)
+    return recorder.t, y.view(complex).reshape(-1, B, N)
 
 
 def scan_phase_locking_region(lam, sigma_range, mu_tilde_range, n_sigma=40,
-                               n_mu=40, n_trials=5, seed=42):
+                               n_mu=40, n_trials=5, seed=42,
+                               locked_solver=False):
     """Scan parameter space for phase-locking in 2-cell feedforward network.
 
     Uses the reduced parameters: σ̃ = σ/λ (frequency mismatch), μ̃ = μ/λ (excitation).
@@ -120,6 +599,9 @@ def scan_phase_locking_region(lam, sigma_range, mu_tilde_range, n_sigma=40,
         n_sigma, n_mu: Grid resolution.
         n_trials: Trials per point.
         seed: Random seed.
+        locked_solver: Solve chains with a fast-attracting locked orbit
+            instead of integrating them; see
+            ``simulate_stuart_landau_ff_batch``.
 
     Returns:
         sigma_grid: 1D array of σ̃ values.
@@ -131,27 +613,139 @@ def scan_phase_locking_region(lam, sigma_range, mu_tilde_range, n_sigma=40,
     lock_fraction = np.zeros((n_mu, n_sigma))
 
     for i, mu_t in enumerate(mu_grid):
-        for j, sig_t in enumerate(sigma_grid):
-            # Two-cell feedforward: node 1 has (μ₁, ω₁), node 2 has (μ₂, ω₂)
-            # With barycentric condition: μ₁ + μ₂ = 2μ_nom, ω₁ + ω₂ = 2ω_nom
-            # Reduced: μ = μ_nom (common), σ = (ω₁ - ω₂)/2
-            mu_val = mu_t * lam
-            sigma_val = sig_t * lam
-
-            mu_arr = np.array([mu_val, mu_val])  # Same excitation
-            omega_arr = np.array([sigma_val, -sigma_val])  # Frequency mismatch (zero mean)
-
-            n_locked = 0
-            for trial in range(n_trials):
-                try:
-                    _, _, locked = simulate_stuart_landau_ff(
-                        mu_arr, omega_arr, lam, T=150.0, t_transient=80.0,
-                        seed=seed + i * n_sigma * n_trials + j * n_trials + trial
-                    )
-                    if locked:
-                        n_locked += 1
-                except Exception:
-                    pass
-            lock_fraction[i, j] = n_locked / n_trials
+        seeds = seed + i * n_sigma * n_trials + np.arange(n_sigma * n_trials)
+        lock_fraction[i] = _lock_fraction(lam, mu_t, sigma_grid, n_trials,
+                                          seeds, locked_solver)
 
     return sigma_grid, mu_grid, lock_fraction
+
+
+def scan_phase_locking_region_adaptive(lam, sigma_range, mu_tilde_range,
+                                       n_coarse=9, max_depth=4, n_trials=5,
+                                       seed=42, locked_solver=False):
+    """Adaptive version of ``scan_phase_locking_region``.
+
+    Refines a coarse grid only around the locking boundary; see
+    ``refine_locking_boundary``. The boundary is resolved to
+    1/2^max_depth of the coarse spacing.
+
+    Returns:
+        sigma, mu: Reduced coordinates of the evaluated points, shape (P,).
+        lock_fraction: Fraction locked per point, shape (P,).
+        area_fraction: Locked fraction of the scanned rectangle.
+    """
+    def evaluate(sigma_t, mu_t, keys):
+        # All new points of a level form one batch
+        seeds = seed + n_trials * np.repeat(keys, n_trials) \
+            + np.tile(np.arange(n_trials), len(keys))
+        return _lock_fraction(lam, mu_t, sigma_t, n_trials, seeds,
+                              locked_solver)
+
+    return refine_locking_boundary(evaluate, sigma_range, mu_tilde_range,
+                                   n_coarse=n_coarse, max_depth=max_depth)
+
+
+def _lock_fraction(lam, mu_t, sigma_t, n_trials, seeds, locked_solver=False):
+    """Lock fraction at points (σ̃, μ̃), integrated as one batch.
+
+    Args:
+        mu_t: μ̃ per point, or one value shared by all points.
+        sigma_t: σ̃ per point.
+        seeds: n_trials seeds per point, point-major.
+        locked_solver: Passed to ``simulate_stuart_landau_ff_batch``.
+
+    Returns:
+        Fraction of trials locked per σ̃ value.
+    """
+    # Two-cell feedforward: node 1 has (μ₁, ω₁), node 2 has (μ₂, ω₂)
+    # With barycentric condition: μ₁ + μ₂ = 2μ_nom, ω₁ + ω₂ = 2ω_nom
+    # Reduced: μ = μ_nom (common), σ = (ω₁ - ω₂)/2
+    mu_vals = np.repeat(np.broadcast_to(mu_t, np.shape(sigma_t)) * lam, n_trials)
+    sigma_vals = np.repeat(np.asarray(sigma_t) * lam, n_trials)
+
+    mu_arr = np.column_stack([mu_vals, mu_vals])  # Same excitation
+    omega_arr = np.column_stack([sigma_vals, -sigma_vals])  # Frequency mismatch (zero mean)
+
+    try:
+        _, _, locked = simulate_stuart_landau_ff_batch(
+            mu_arr, omega_arr, lam, T=150.0, t_transient=80.0,
+            seeds=seeds, n_keep=101, locked_solver=locked_solver
+        )
+    except RuntimeError:
+        # Fall back to one chain at a time; failures count as unlocked
+        locked = np.zeros(len(seeds), dtype=bool)
+        for b, (mu_b, omega_b, seed_b) in enumerate(zip(mu_arr, omega_arr,
+                                                        seeds)):
+            try:
+                _, _, locked[b] = simulate_stuart_landau_ff(
+                    mu_b, omega_b, lam, T=150.0, t_transient=80.0,
+                    seed=seed_b
+                )
+            except RuntimeError:
+                pass
+    return np.mean(locked.reshape(-1, n_trials), axis=1)
+
+
+def refine_locking_boundary(evaluate, sigma_range, mu_range, n_coarse=9,
+                            max_depth=4):
+    """Locked region of a 2D parameter scan by quadtree refinement.
+
+    Starts from an n_coarse x n_coarse grid of corner points and splits every
+    cell whose corners disagree on lock status (lock fraction >= 0.5) into
+    four, up to max_depth times. The boundary ends up resolved to
+    1/2^max_depth of the coarse spacing while cells inside and outside the
+    region stay coarse. The locked area is the trapezoidal-rule integral of
+    the lock indicator over the leaf cells. Features that fit inside one
+    coarse cell without touching its corners are missed.
+
+    Args:
+        evaluate: Function (sigma, mu, keys) -> lock fraction per point,
+            called once per refinement level with all points not yet
+            evaluated. keys are integer lattice indices identifying each
+            point independently of the refinement order, e.g. for seeding.
+        sigma_range: (min, max) of the first coordinate.
+        mu_range: (min, max) of the second coordinate.
+        n_coarse: Points per axis of the initial grid.
+        max_depth: Number of refinement levels.
+
+    Returns:
+        sigma, mu: Coordinates of the evaluated points, shape (P,).
+        lock_fraction: Value of evaluate per point, shape (P,).
+        area_fraction: Locked fraction of the scanned rectangle.
+    """
+    scale = 2**max_depth
+    n_fine = (n_coarse - 1) * scale + 1
+    sigma_axis = np.linspace(sigma_range[0], sigma_range[1], n_fine)
+    mu_axis = np.linspace(mu_range[0], mu_range[1], n_fine)
+    corners = ((0, 0), (1, 0), (0, 1), (1, 1))
+
+    lock = {}  # (σ index, μ index) on the finest lattice -> lock fraction
+    # Cells as (σ index, μ index) of the lower-left corner and side length
+    cells = [(i, j, scale) for i in range(0, n_fine - 1, scale)
+             for j in range(0, n_fine - 1, scale)]
+    locked_area = 0.0
+    while cells:
+        # μ-major, so that consecutive points mostly share μ
+        new = sorted({(i + di * s, j + dj * s) for i, j, s in cells
+                      for di, dj in corners} - lock.keys(),
+                     key=lambda point: (point[1], point[0]))
+        if new:
+            index = np.array(new)
+            values = evaluate(sigma_axis[index[:, 0]], mu_axis[index[:, 1]],
+                              index[:, 1] * n_fine + index[:, 0])
+            lock.update(zip(new, values))
+
+        split = []
+        for i, j, s in cells:
+            locked = [lock[i + di * s, j + dj * s] >= 0.5 for di, dj in corners]
+            if s > 1 and any(locked) and not all(locked):
+                h = s // 2
+                split += [(i + di * h, j + dj * h, h) for di, dj in corners]
+            else:
+                locked_area += s**2 * np.mean(locked)
+        cells = split
+
+    index = np.array(sorted(lock))
+    return (sigma_axis[index[:, 0]], mu_axis[index[:, 1]],
+            np.array([lock[i, j] for i, j in index]),
+            locked_area / (n_fine - 1)**2)
@@ -0,0 +1,93 @@
+"""
+Parallel execution of parameter sweeps.
+
+The experiment drivers describe a sweep as a list of independent tasks, each
+a dict of keyword arguments for one module-level function, and hand it to
+``run_sweep``. The tasks run in a process pool and the results come back in
+task order, so the drivers reassemble them into the same arrays and JSON
+layout as a serial loop would.
+
+Every task carries its own seed, computed in the parent before submission,
+so results do not depend on the number of workers or on scheduling.
+
+With a ``CellCache`` the sweep is resumable: each cell is written to disk as
+soon as it finishes and cells already in the cache are not recomputed.
+"""
+
+import os
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from cache import task_key, to_jsonable
+
+# Default pool size; set SWEEP_WORKERS=1 to run sweeps serially in-process.
+N_WORKERS = int(os.environ.get('SWEEP_WORKERS', os.cpu_count() or 1))
+
+
+def task_seed(base, *key):
+    """Derive a reproducible seed for a task from a base seed and its key.
+
+    Unlike ``hash()``, which is salted per interpreter for strings, the CRC
+    of the key's repr is the same in every process and every run. Key values
+    are converted to plain Python types first (``cache.to_jsonable``), since
+    the repr of numpy scalars differs between numpy versions.
+
+    Args:
+        base: Base random seed.
+        *key: Values identifying the task, e.g. (topology, distribution, ki).
+
+    Returns:
+        Seed in [0, 2**31).
+    """
+    key = tuple(to_jsonable(value) for value in key)
+    return (base + zlib.crc32(repr(key).encode())) % (2**31)
+
+
+def run_sweep(fn, tasks, max_workers=None, cache=None):
+    """Evaluate ``fn(**task)`` for every task, in parallel.
+
+    Args:
+        fn: Module-level (picklable) function.
+        tasks: List of keyword-argument dicts, one per task.
+        max_workers: Pool size. Defaults to ``N_WORKERS``; 1 runs serially
+            without starting a pool.
+        cache: Optional ``CellCache``. Cached tasks are skipped and every
+            newly finished task is persisted as it completes. All results
+            are then returned in JSON form (arrays as lists), whether they
+            were computed or read back.
+
+    Returns:
+        List of results, in the same order as tasks.
+    """
+    if max_workers is None:
+        max_workers = N_WORKERS
+
+    results = [None] * len(tasks)
+    pending = list(range(len(tasks)))
+    if cache is not None:
+        keys = [task_key(fn, task) for task in tasks]
+        pending = []
+        for i, key in enumerate(keys):
+            if key in cache:
+                results[i] = cache.get(key)
+            else:
+                pending.append(i)
+        if len(pending) < len(tasks):
+            print(f"  Resuming sweep: {len(tasks) - len(pending)}/{len(tasks)} "
+                  f"cells cached")
+
+    def store(i, value):
+        if cache is not None:
+            value = cache.put(keys[i], value)
+        results[i] = value
+
+    if max_workers <= 1 or len(pending) <= 1:
+        for i in pending:
+            store(i, fn(**tasks[i]))
+        return results
+
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(pending))) as pool:
+        futures = {pool.submit(fn, **tasks[i]): i for i in pending}
+        for future in as_completed(futures):
+            store(futures[future], future.result())
+    return results
@@ -0,0 +1,113 @@
+"""
+Synchrony alignment function: linearized theory of the locked Kuramoto state.
+
+For strong coupling the phases of a locked network stay close together and
+sin(θ_j - θ_i) ≈ θ_j - θ_i. With the coupling (K/N) Σ_j A_ij sin(θ_j - θ_i)
+of ``kuramoto.kuramoto_rhs`` and zero-mean ω, the locked phases become
+θ = (N/K) L⁺ω, with L⁺ the pseudo-inverse of the graph Laplacian, and
+
+    r ≈ 1 - N² J(ω, L) / (2K²),    J(ω, L) = ω^T (L⁺)² ω / N
+                                            = Σ_{j≥2} ⟨v_j, ω⟩² / (N λ_j²).
+
+J is the synchrony alignment function (SAF) of Skardal, Taylor & Restrepo
+(2014). It scores a frequency vector by how well it aligns with the
+high-λ Laplacian modes. It costs one eigendecomposition per graph, against
+a full set of simulations per vector, and so makes a cheap surrogate for
+ranking candidate disorder vectors. The prediction is only accurate where
+r is close to 1; away from that it is useful for ranking vectors of equal
+norm, not for absolute values.
+"""
+
+import numpy as np
+
+from networks import laplacian_spectrum, Topology, ZERO_EIGENVALUE_TOL
+
+
+def laplacian_pseudoinverse(adj_matrix, tol=ZERO_EIGENVALUE_TOL):
+    """Moore-Penrose pseudo-inverse L⁺ of the graph Laplacian.
+
+    Args:
+        adj_matrix: Symmetric adjacency matrix, shape (N, N), or a
+            ``networks.Topology``, whose memoized L⁺ is returned for the
+            default tol.
+        tol: Eigenvalues below tol count as zero modes.
+
+    Returns:
+        Dense array, shape (N, N).
+    """
+    if isinstance(adj_matrix, Topology) and tol == ZERO_EIGENVALUE_TOL:
+        return adj_matrix.laplacian_pinv
+    eigenvalues, vectors = laplacian_spectrum(adj_matrix, return_vectors=True)
+    inverse = np.zeros_like(eigenvalues)
+    nonzero = eigenvalues > tol
+    inverse[nonzero] = 1.0 / eigenvalues[nonzero]
+    return (vectors * inverse) @ vectors.T
+
+
+def synchrony_alignment(omega, adj_matrix, L_pinv=None):
+    """Synchrony alignment function J(ω, L) = ω^T (L⁺)² ω / N.
+
+    The mean of ω is irrelevant, since L⁺ annihilates constant vectors.
+
+    Args:
+        omega: Frequencies, shape (N,) or (S, N) for S vectors.
+        adj_matrix: Symmetric adjacency matrix, shape (N, N).
+        L_pinv: Precomputed ``laplacian_pseudoinverse(adj_matrix)``.
+
+    Returns:
+        J, scalar or shape (S,).
+    """
+    if L_pinv is None:
+        L_pinv = laplacian_pseudoinverse(adj_matrix)
+    theta = np.asarray(omega, dtype=float) @ L_pinv
+    return np.sum(theta**2, axis=-1) / L_pinv.shape[0]
+
+
+def synchrony_alignment_gradient(omega, adj_matrix, L_pinv=None):
+    """Gradient of ``synchrony_alignment`` with respect to ω.
+
+    Equal to 2 (L⁺)² ω / N. It has zero mean, so a gradient step keeps the
+    barycentric condition Σω_i = 0.
+
+    Returns:
+        Array of the same shape as omega.
+    """
+    if L_pinv is None:
+        L_pinv = laplacian_pseudoinverse(adj_matrix)
+    omega = np.asarray(omega, dtype=float)
+    return 2 * (omega @ L_pinv) @ L_pinv / L_pinv.shape[0]
+
+
+def predicted_order_parameter(omega, K, adj_matrix, L_pinv=None):
+    """Linearized prediction of the locked order parameter.
+
+    Returns:
+        1 - N² J / (2K²), scalar or shape (S,). Not clipped; values far
+        below 1 mean the linear theory does not apply.
+    """
+    N = np.shape(adj_matrix)[0]
+    J = synchrony_alignment(omega, adj_matrix, L_pinv)
+    return 1 - N**2 * J / (2 * np.asarray(K, dtype=float)**2)
+
+
+def optimal_frequencies(adj_matrix, norm=1.0):
+    """Zero-mean frequency vector of given norm that minimizes the SAF.
+
+    Among vectors orthogonal to the constant mode, J is smallest along the
+    eigenvector of the largest Laplacian eigenvalue λ_N, where it equals
+    norm² / (N λ_N²). The sign is fixed so that the first nonzero entry is
+    positive. If λ_N is degenerate, any vector in its eigenspace is equally
+    good and one of them is returned.
+
+    Args:
+        adj_matrix: Symmetric adjacency matrix, shape (N, N).
+        norm: Euclidean norm of the result.
+
+    Returns:
+        Frequencies, shape (N,).
+    """
+    _, vectors = laplacian_spectrum(adj_matrix, return_vectors=True)
+    v = vectors[:, -1]
+    if v[np.flatnonzero(np.abs(v) > 1e-12)[0]] < 0:
+        v = -v
+    return norm * v
@@ -0,0 +1,36 @@
+"""Cache keys for tasks holding sparse and graph-object adjacency matrices."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+from scipy import sparse
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from cache import task_key
+from networks import ring_graph
+
+
+def _cell(adj_matrix, K):
+    return K
+
+
+def test_task_key_accepts_sparse_adjacency():
+    adj = ring_graph(8, 1)
+    key = task_key(_cell, {'adj_matrix': sparse.csr_array(adj), 'K': 1.0})
+    # Same matrix in another sparse format gives the same key
+    assert key == task_key(_cell, {'adj_matrix': sparse.coo_array(adj),
+                                   'K': 1.0})
+    assert key != task_key(_cell, {'adj_matrix': sparse.csr_array(2 * adj),
+                                   'K': 1.0})
+    assert key != task_key(_cell, {'adj_matrix': sparse.csr_array(adj),
+                                   'K': 2.0})
+
+
+def test_task_key_distinguishes_sparse_shapes():
+    empty = {'adj_matrix': sparse.csr_array((4, 4)), 'K': 1.0}
+    larger = {'adj_matrix': sparse.csr_array((5, 5)), 'K': 1.0}
+    dense = {'adj_matrix': np.zeros((4, 4)), 'K': 1.0}
+    assert task_key(_cell, empty) != task_key(_cell, larger)
+    assert task_key(_cell, empty) != task_key(_cell, dense)
@@ -0,0 +1,62 @@
+"""integrate_streaming on a linear ODE with a known solution."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from integrators import STREAM_CHUNK, integrate_streaming
+
+
+def _decay(t, y, rate):
+    return -rate * y
+
+
+class _Recorder:
+    def __init__(self):
+        self.t = []
+        self.y = []
+
+    def __call__(self, t, y):
+        self.t.append(np.array(t))
+        self.y.append(np.array(y))
+
+
+@pytest.mark.parametrize('method, tol', [('euler', 1e-2), ('heun', 1e-4),
+                                         ('rk4', 1e-8), ('RK45', 1e-7)])
+def test_streaming_matches_exponential_decay(method, tol):
+    y0 = np.array([1.0, -2.0])
+    dt = 0.01
+    rec = _Recorder()
+    y_last = integrate_streaming(_decay, (0.0, 5.0), y0, dt, rec,
+                                 method=method, args=(0.7,))
+
+    t = np.concatenate(rec.t)
+    y = np.concatenate(rec.y, axis=1)
+    assert np.allclose(t, np.arange(0.0, 5.0, dt))
+    exact = y0[:, np.newaxis] * np.exp(-0.7 * t)
+    assert np.max(np.abs(y - exact)) < tol
+    assert np.array_equal(y_last, y[:, -1])
+    if method == 'rk4':
+        assert max(len(block) for block in rec.t) == STREAM_CHUNK
+
+
+def test_observer_can_stop_fixed_step_run():
+    seen = []
+
+    def observer(t, y):
+        seen.append(len(t))
+        return True
+
+    integrate_streaming(_decay, (0.0, 10.0), np.ones(1), 0.01, observer,
+                        method='rk4', args=(1.0,))
+    assert seen == [STREAM_CHUNK]
+
+
+def test_unknown_method_raises():
+    with pytest.raises(ValueError):
+        integrate_streaming(_decay, (0.0, 1.0), np.ones(1), 0.1,
+                            lambda t, y: None, method='leapfrog', args=(1.0,))
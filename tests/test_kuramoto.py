@@ -0,0 +1,101 @@
+"""Kuramoto right-hand sides against the pairwise kernel, and batch options."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from scipy import sparse
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from kuramoto import (
+    _kuramoto_rhs_pairwise, kuramoto_rhs, kuramoto_rhs_batch,
+    simulate_kuramoto_batch,
+)
+from networks import CirculantGraph
+
+N = 12
+B = 5
+
+
+def _adjacency(kind):
+    rng = np.random.default_rng(0)
+    mask = np.triu(rng.random((N, N)) < 0.4, 1)
+    adj = (mask | mask.T).astype(float)
+    if kind == 'weighted':
+        weights = rng.uniform(0.1, 2.0, (N, N))
+        adj *= weights + weights.T
+    return adj
+
+
+@pytest.fixture(params=['binary', 'weighted'])
+def adj_dense(request):
+    return _adjacency(request.param)
+
+
+@pytest.fixture(params=['dense', 'coo'])
+def fmt(request):
+    return request.param
+
+
+def _as_format(adj, fmt):
+    return sparse.coo_array(adj) if fmt == 'coo' else adj
+
+
+def test_single_state_matches_pairwise(adj_dense, fmt):
+    rng = np.random.default_rng(1)
+    theta = rng.uniform(-np.pi, np.pi, N)
+    omega = rng.normal(0.0, 1.0, N)
+    K = 1.7
+
+    expected = _kuramoto_rhs_pairwise(theta, omega, K, adj_dense)
+    result = kuramoto_rhs(0.0, theta, omega, K, _as_format(adj_dense, fmt))
+    assert result.shape == (N,)
+    assert np.allclose(result, expected)
+
+
+def test_batch_matches_pairwise(adj_dense, fmt):
+    rng = np.random.default_rng(2)
+    theta = rng.uniform(-np.pi, np.pi, (B, N))
+    omega = rng.normal(0.0, 1.0, (B, N))
+    K = rng.uniform(0.5, 3.0, (B, 1))
+
+    expected = _kuramoto_rhs_pairwise(theta, omega, K, adj_dense)
+    result = kuramoto_rhs_batch(0.0, theta.ravel(), omega, K,
+                                _as_format(adj_dense, fmt))
+    assert result.shape == (B * N,)
+    assert np.allclose(result.reshape(B, N), expected)
+
+
+def test_batch_rows_match_single_state(adj_dense):
+    rng = np.random.default_rng(3)
+    theta = rng.uniform(-np.pi, np.pi, (B, N))
+    omega = rng.normal(0.0, 1.0, (B, N))
+    K = rng.uniform(0.5, 3.0, (B, 1))
+
+    batch = kuramoto_rhs_batch(0.0, theta.ravel(), omega, K, adj_dense)
+    single = [kuramoto_rhs(0.0, theta[b], omega[b], K[b, 0], adj_dense)
+              for b in range(B)]
+    assert np.allclose(batch.reshape(B, N), single)
+
+
+def test_circulant_matches_pairwise():
+    graph = CirculantGraph(N, [1, 3])
+    rng = np.random.default_rng(4)
+    theta = rng.uniform(-np.pi, np.pi, (B, N))
+    omega = rng.normal(0.0, 1.0, (B, N))
+    K = rng.uniform(0.5, 3.0, (B, 1))
+
+    expected = _kuramoto_rhs_pairwise(theta, omega, K, graph.toarray())
+    assert np.allclose(kuramoto_rhs(0.0, theta[0], omega[0], K[0, 0], graph),
+                       expected[0])
+    assert np.allclose(kuramoto_rhs_batch(0.0, theta.ravel(), omega, K, graph),
+                       expected.ravel())
+
+
+def test_locked_solver_rejects_return_state():
+    with pytest.raises(ValueError):
+        simulate_kuramoto_batch(np.zeros(N), 1.0, _adjacency('binary'),
+                                seeds=[0], return_state=True,
+                                locked_solver=True)
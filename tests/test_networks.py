@@ -0,0 +1,33 @@
+"""Degree sequences across the adjacency representations."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from scipy import sparse
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from experiment1_kuramoto_disorder import generate_frequency_distributions
+from networks import CirculantGraph, Topology, node_degrees, star_graph
+
+
+@pytest.mark.parametrize('wrap', [np.asarray, sparse.csr_array, Topology])
+def test_node_degrees_accepts_all_representations(wrap):
+    adj = star_graph(6)
+    assert np.array_equal(node_degrees(wrap(adj)), [5, 1, 1, 1, 1, 1])
+
+
+def test_node_degrees_circulant():
+    graph = CirculantGraph(10, [1, 5])
+    assert np.array_equal(node_degrees(graph), graph.toarray().sum(axis=1))
+
+
+def test_frequency_distributions_accept_plain_arrays():
+    adj = star_graph(6)
+    from_array = generate_frequency_distributions(adj, 6)
+    from_topology = generate_frequency_distributions(Topology(adj), 6)
+    for name, omega in from_array.items():
+        assert np.allclose(omega, from_topology[name])
+    assert from_array['degree_correlated'][0] > 0
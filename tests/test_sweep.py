@@ -0,0 +1,23 @@
+"""Seeds derived by task_seed."""
+
+import sys
+import zlib
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from sweep import task_seed
+
+
+def test_task_seed_ignores_numpy_scalar_types():
+    plain = task_seed(42, 'ring', 'uniform_disorder', 3, 0.5)
+    assert plain == task_seed(42, np.str_('ring'), 'uniform_disorder',
+                              np.int64(3), np.float64(0.5))
+
+
+def test_task_seed_keeps_seeds_of_plain_keys():
+    key = ('ring', 'uniform_disorder', 3, 7)
+    expected = (42 + zlib.crc32(repr(key).encode())) % (2**31)
+    assert task_seed(42, *key) == expected